@@ -1,4 +1,3 @@
-import inspect
 import os
 import sys
 import warnings
@@ -47,6 +46,8 @@ def _set_workdir(workdir, nback):
             _workdir = os.path.abspath(os.fspath(workdir))
         return
 
+    import inspect
+
     frame = inspect.currentframe()
     for n in range(nback):
         frame = frame.f_back if frame is not None else None
@@ -128,13 +129,39 @@ def _is_seamless_worker() -> bool:
     return False
 
 
+def _remote_initializers(cluster: str, remote_modules: list) -> list:
+    """
+    Return a function per remote module that initializes its clients,
+    i.e. launches and connects to their servers, retrying connection errors
+    according to the connect_policy of the cluster.
+    """
+    from dataclasses import asdict
+    from .cluster import get_cluster
+    from .retry import call_with_retry
+
+    connect_policy = get_cluster(cluster).connect_policy
+    policy = asdict(connect_policy) if connect_policy is not None else None
+
+    def initializer(remote_module):
+        name = remote_module.__name__.rsplit(".", 1)[-1].removesuffix("_remote")
+        return lambda: call_with_retry(remote_module.ensure_initialized, policy, name)
+
+    return [initializer(remote_module) for remote_module in remote_modules]
+
+
 def change_stage():
     from .select import get_selected_cluster
     from .cluster import get_cluster, get_local_cluster
-    from .select import get_execution, get_persistent
+    from .select import get_activation, get_execution, get_persistent
+    from . import lazy_remotes
+    from .extern_clients import _stop_probers
+    from .tools import clear_configure_cache
 
     global _initialized
 
+    lazy_remotes.clear()
+    clear_configure_cache()
+    _stop_probers()
     persistent = get_persistent()
     try:
         from .pure_daskserver import deactivate as pure_deactivate
@@ -185,17 +212,30 @@ def change_stage():
 
                 from .select import check_remote_redundancy
 
+                remote_modules = [
+                    seamless_remote.buffer_remote,
+                    seamless_remote.database_remote,
+                ]
+                seamless_remote.buffer_remote.activate()
+                seamless_remote.database_remote.activate()
                 if execution == "remote":
                     remote = check_remote_redundancy(cluster)
-                    seamless_remote.buffer_remote.activate()
-                    seamless_remote.database_remote.activate()
                     if remote == "jobserver":
                         seamless_remote.jobserver_remote.activate()
+                        remote_modules.append(seamless_remote.jobserver_remote)
                     elif remote == "daskserver":
                         seamless_remote.daskserver_remote.activate()
-                else:
-                    seamless_remote.buffer_remote.activate()
-                    seamless_remote.database_remote.activate()
+                        remote_modules.append(seamless_remote.daskserver_remote)
+                # The clients launch their servers on first use ('lazy'),
+                # unless they are initialized now
+                activation = get_activation()
+                if activation in ("eager", "prewarm"):
+                    initializers = _remote_initializers(cluster, remote_modules)
+                    if activation == "eager":
+                        for initialize in initializers:
+                            initialize()
+                    else:
+                        lazy_remotes.prewarm(initializers)
 
     if get_execution() == "spawn":
         from seamless.transformer import spawn
@@ -203,6 +243,15 @@ def change_stage():
         local_cluster = get_cluster(get_local_cluster())
         spawn(local_cluster.workers)
 
+    from . import memory_cache
+    from .select import get_memory_cache_size
+
+    memory_cache_size = get_memory_cache_size()
+    if memory_cache_size:
+        memory_cache.activate(memory_cache_size)
+    else:
+        memory_cache.deactivate()
+
     _initialized = True
 
 
@@ -238,7 +287,10 @@ def set_stage(
 
     if workdir is _UNSET and not _set_workdir_called:
         _set_workdir(_UNSET, 2)
-    load_config_files()
+    from .daemon import resolve_config
+
+    if not resolve_config():
+        load_config_files()
     _report_execution_requirements()
     if stage_change:
         change_stage()
@@ -283,7 +335,23 @@ def init(*, workdir=_UNSET):
     return set_stage(workdir=workdir)
 
 
-from .extern_clients import collect_remote_clients, set_remote_clients
+_LAZY_ATTRIBUTES = {
+    "collect_remote_clients": ".extern_clients",
+    "set_remote_clients": ".extern_clients",
+}
+
+
+def __getattr__(name):
+    # Keep "import seamless_config" cheap for worker bootstrap code
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "init",
@@ -0,0 +1,57 @@
+"""JSON files that are shared between processes of the same user.
+
+Used for the port leases (ports.py) and the task duration history
+(durations.py). The lock is an fcntl lock on a separate ".lock" file, so that
+the data file itself can be replaced atomically.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+
+class LockedJsonFile:
+    """
+    A JSON file that holds a dict, under an exclusive lock while in use.
+
+    Entering the context locks the file and returns its content (an empty dict
+    if it does not exist or is not valid); save() replaces the file atomically.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock_handle = None
+
+    def __enter__(self) -> dict[str, Any]:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock_handle = open(self.path + ".lock", "a")
+        try:
+            import fcntl
+        except ImportError:  # not on Unix
+            pass
+        else:
+            fcntl.flock(self._lock_handle, fcntl.LOCK_EX)
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        return data
+
+    def save(self, data: dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def __exit__(self, *args) -> None:
+        # Closing the file releases the lock
+        self._lock_handle.close()
+        self._lock_handle = None
+
+
+__all__ = ["LockedJsonFile"]
@@ -14,6 +14,7 @@ class ClusterFrontendHashserver:
     network_interface: Optional[str] = None
     port_start: Optional[int] = None
     port_end: Optional[int] = None
+    shared_filesystem: bool = False
 
     def __post_init__(self):
         if (self.port_start is None) != (self.port_end is None):
@@ -50,6 +51,117 @@ class ClusterFrontendDaskserver:
     network_interface: str
     port_start: int
     port_end: int
+    internal_port_start: Optional[int] = None
+    internal_port_end: Optional[int] = None
+
+    def __post_init__(self):
+        if (self.internal_port_start is None) != (self.internal_port_end is None):
+            raise TypeError(
+                "daskserver: 'internal_port_start' and 'internal_port_end' must both be set or both be omitted"
+            )
+        if (
+            self.internal_port_start is not None
+            and self.internal_port_start > self.internal_port_end
+        ):
+            raise TypeError(
+                "daskserver: 'internal_port_start' must not be larger than 'internal_port_end'"
+            )
+
+    def get_internal_port_range(self) -> str | None:
+        """Port range of the Dask workers and nannies, in Dask's "start:end" format."""
+        if self.internal_port_start is None:
+            return None
+        return f"{self.internal_port_start}:{self.internal_port_end}"
+
+
+@dataclass
+class ClusterClientProbing:
+    """Latency probing and ordering of the clients forwarded to workers."""
+
+    timeout: float | str = "2s"
+    reprobe_interval: float | str | None = None
+
+    def __post_init__(self):
+        from .units import parse_duration
+
+        try:
+            self.timeout = parse_duration(self.timeout, "client_probing.timeout")
+            if self.reprobe_interval is not None:
+                self.reprobe_interval = parse_duration(
+                    self.reprobe_interval, "client_probing.reprobe_interval"
+                )
+        except ValueError as exc:
+            raise TypeError(str(exc)) from None
+
+
+@dataclass
+class ClusterConnectPolicy:
+    """Retry policy (jittered exponential backoff) for connecting to remote services."""
+
+    max_attempts: int = 5
+    base_delay: float | str = "0.5s"
+    max_delay: float | str = "30s"
+    budget: float | str | None = "2m"
+    initial_jitter: float | str = "0s"
+
+    def __post_init__(self):
+        from .units import parse_duration
+
+        if (
+            isinstance(self.max_attempts, bool)
+            or not isinstance(self.max_attempts, int)
+            or self.max_attempts < 1
+        ):
+            raise TypeError("connect_policy: 'max_attempts' must be a positive integer")
+        try:
+            for field in ("base_delay", "max_delay", "budget", "initial_jitter"):
+                value = getattr(self, field)
+                if value is not None:
+                    setattr(
+                        self, field, parse_duration(value, f"connect_policy.{field}")
+                    )
+        except ValueError as exc:
+            raise TypeError(str(exc)) from None
+
+
+@dataclass
+class ClusterPortLeases:
+    """Non-overlapping port sub-ranges per launched server, leased in a local file."""
+
+    block_size: int = 10
+    ttl: float | str = "1h"
+    probe: bool | None = None  # None: probe the ports of local clusters only
+
+    def __post_init__(self):
+        from .units import parse_duration
+
+        if (
+            isinstance(self.block_size, bool)
+            or not isinstance(self.block_size, int)
+            or self.block_size < 1
+        ):
+            raise TypeError("port_leases: 'block_size' must be a positive integer")
+        if self.probe is not None and not isinstance(self.probe, bool):
+            raise TypeError("port_leases: 'probe' must be a boolean or null")
+        try:
+            self.ttl = parse_duration(self.ttl, "port_leases.ttl")
+        except ValueError as exc:
+            raise TypeError(str(exc)) from None
+
+
+@dataclass
+class ClusterTaskDurations:
+    """Learned task durations (see durations.py), passed to the daskserver as hints."""
+
+    max_entries: int = 1000
+
+    def __post_init__(self):
+        if (
+            isinstance(self.max_entries, bool)
+            or not isinstance(self.max_entries, int)
+            or self.max_entries < 1
+        ):
+            raise TypeError("task_durations: 'max_entries' must be a positive integer")
 
 
 @dataclass
@@ -104,6 +216,121 @@ class ClusterQueue:
     dask_resources: dict[str, str] | None = None
     cores: int | None = None
     job_cores: int | None = None
+    transformation_throttle: int | None = None
+    transformation_throttle_per_worker: int | None = None
+    cost: float | None = None
+    spillover: list[str] | None = None
+    spillover_pending_time: str | None = None
+    minimum_jobs: int | None = None
+    adapt_interval: str | None = None
+    adapt_wait_count: int | None = None
+    target_utilization: float | None = None
+
+    def validate(self, cluster_type: str | None) -> None:
+        """Check the consistency of the queue fields, raising TypeError."""
+        queue_name = self.name
+        if self.exclusive:
+            if self.job_cores is not None:
+                raise TypeError(
+                    f"Queue '{queue_name}': 'job_cores' must not be set in exclusive mode"
+                )
+            if self.cores is None and cluster_type == "local":
+                raise TypeError(
+                    f"Queue '{queue_name}': 'cores' is required for local cluster exclusive mode"
+                )
+        else:
+            if self.cores is None and cluster_type != "local":
+                raise TypeError(
+                    f"Queue '{queue_name}': 'cores' is required when 'exclusive' is not set"
+                )
+        for field in ("transformation_throttle", "transformation_throttle_per_worker"):
+            value = getattr(self, field)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                raise TypeError(
+                    f"Queue '{queue_name}': '{field}' must be a positive integer"
+                )
+        if self.cost is not None and (
+            isinstance(self.cost, bool)
+            or not isinstance(self.cost, (int, float))
+            or self.cost < 0
+        ):
+            raise TypeError(f"Queue '{queue_name}': 'cost' must be a non-negative number")
+        if self.spillover is not None:
+            if not isinstance(self.spillover, list) or not all(
+                isinstance(name, str) for name in self.spillover
+            ):
+                raise TypeError(
+                    f"Queue '{queue_name}': 'spillover' must be a list of queue names"
+                )
+            if queue_name in self.spillover:
+                raise TypeError(f"Queue '{queue_name}': cannot spill over to itself")
+            if len(set(self.spillover)) != len(self.spillover):
+                raise TypeError(f"Queue '{queue_name}': duplicate 'spillover' queues")
+        if self.spillover_pending_time is not None:
+            from .units import parse_duration
+
+            try:
+                parse_duration(
+                    self.spillover_pending_time,
+                    f"queue {queue_name}: spillover_pending_time",
+                )
+            except ValueError as exc:
+                raise TypeError(str(exc)) from None
+        self._validate_adaptive()
+
+    def _validate_adaptive(self) -> None:
+        queue_name = self.name
+        for field, minimum in (("minimum_jobs", 0), ("adapt_wait_count", 1)):
+            value = getattr(self, field)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < minimum
+            ):
+                kind = "non-negative" if minimum == 0 else "positive"
+                raise TypeError(f"Queue '{queue_name}': '{field}' must be a {kind} integer")
+        if (
+            self.minimum_jobs is not None
+            and self.maximum_jobs is not None
+            and self.minimum_jobs > self.maximum_jobs
+        ):
+            raise TypeError(
+                f"Queue '{queue_name}': 'minimum_jobs' must not exceed 'maximum_jobs'"
+            )
+        if self.adapt_interval is not None:
+            from .units import parse_duration
+
+            try:
+                interval = parse_duration(
+                    self.adapt_interval, f"queue {queue_name}: adapt_interval"
+                )
+            except ValueError as exc:
+                raise TypeError(str(exc)) from None
+            if interval <= 0:
+                raise TypeError(f"Queue '{queue_name}': 'adapt_interval' must be positive")
+        utilization = self.target_utilization
+        if utilization is not None and (
+            isinstance(utilization, bool)
+            or not isinstance(utilization, (int, float))
+            or not 0 < utilization <= 1
+        ):
+            raise TypeError(
+                f"Queue '{queue_name}': 'target_utilization' must be a number in (0, 1]"
+            )
+
+    def with_overrides(self, overrides: dict[str, Any] | None, cluster_type: str | None):
+        """Return a copy of the queue with the fields in overrides replaced."""
+        if not overrides:
+            return self
+        queue = dataclasses.replace(self, **overrides)
+        queue.validate(cluster_type)
+        return queue
+
+
+# Queue fields that the 'queue_overrides' command may set
+QUEUE_OVERRIDE_FIELDS = frozenset(
+    field.name for field in dataclasses.fields(ClusterQueue) if field.name != "name"
+)
 
 
 @dataclass
@@ -130,6 +357,15 @@ class ClusterQueueWithTemplate:
     worker_threads: int | None = None
     processes: int | None = None
     job_cores: int | None = None
+    transformation_throttle: int | None = None
+    transformation_throttle_per_worker: int | None = None
+    cost: float | None = None
+    spillover: list[str] | None = None
+    spillover_pending_time: str | None = None
+    minimum_jobs: int | None = None
+    adapt_interval: str | None = None
+    adapt_wait_count: int | None = None
+    target_utilization: float | None = None
 
 
 @dataclass
@@ -142,6 +378,10 @@ class Cluster:
     memory_per_core_property_name: str | None = None
     queues: dict[str, ClusterQueue] | None = None
     default_queue: str | None = None
+    client_probing: ClusterClientProbing | None = None
+    connect_policy: ClusterConnectPolicy | None = None
+    port_leases: ClusterPortLeases | None = None
+    task_durations: ClusterTaskDurations | None = None
 
     def __post_init__(self):
         assert self.type is None or self.type in ("local", "slurm", "oar")
@@ -158,6 +398,16 @@ class Cluster:
             )
             frontends.append(frontend)
         params["frontends"] = frontends
+        for key, settings_class in _CLUSTER_SETTINGS.items():
+            settings = dic.get(key)
+            if settings is None:
+                params.pop(key, None)
+                continue
+            if settings is True:
+                settings = {}
+            if not isinstance(settings, dict):
+                raise TypeError(f"'{key}' must be a mapping")
+            params[key] = settings_class(**settings)
         queues0 = dic.get("queues", {})
         if queues0:
             queues = {}
@@ -191,34 +441,44 @@ class Cluster:
                     queue_dict.pop("TEMPLATE", None)
 
                 queue = ClusterQueue(**queue_dict)
-                cluster_type = params.get("type")
-                if queue.exclusive:
-                    if queue.job_cores is not None:
-                        raise TypeError(
-                            f"Queue '{queue_name}': 'job_cores' must not be set in exclusive mode"
-                        )
-                    if queue.cores is None and cluster_type == "local":
+                queue.validate(params.get("type"))
+                queues[queue_name] = queue
+            # Spillover queues may be defined after the queue that uses them
+            for queue in queues.values():
+                for spillover_name in queue.spillover or []:
+                    spillover_queue = queues.get(spillover_name)
+                    if spillover_queue is None:
                         raise TypeError(
-                            f"Queue '{queue_name}': 'cores' is required for local cluster exclusive mode"
+                            f"Queue '{queue.name}': unknown spillover queue '{spillover_name}'"
                         )
-                else:
-                    if queue.cores is None and cluster_type != "local":
+                    if spillover_queue.conda != queue.conda:
                         raise TypeError(
-                            f"Queue '{queue_name}': 'cores' is required when 'exclusive' is not set"
+                            f"Queue '{queue.name}': spillover queue '{spillover_name}' "
+                            "must use the same conda environment"
                         )
-                queues[queue_name] = queue
             params["queues"] = queues
         return cls(**params)
 
 
+# Optional cluster-level settings, given as a mapping (or 'true' for defaults)
+_CLUSTER_SETTINGS = {
+    "client_probing": ClusterClientProbing,
+    "connect_policy": ClusterConnectPolicy,
+    "port_leases": ClusterPortLeases,
+    "task_durations": ClusterTaskDurations,
+}
+
 _clusters: dict[str, Cluster] = {}
 _local_cluster = None
 
 
 def define_clusters(clusters):
+    from .tools import clear_configure_cache
+
     global _local_cluster
     assert isinstance(clusters, dict)
     _clusters.clear()
+    clear_configure_cache()
     local_cluster = None
     for key, value in clusters.items():
         assert isinstance(key, str)
@@ -5,30 +5,40 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Iterable, Sequence
 
-import yaml  # type: ignore
-
 from . import get_workdir
 from .cluster import define_clusters as register_clusters
 from .select import (
     PROJECT_TOPLEVEL,
     get_stage,
+    reset_activation_before_load,
+    reset_memory_cache_before_load,
     reset_node_before_load,
+    reset_queue_overrides_before_load,
+    reset_queue_routing_before_load,
+    reset_worker_pools_before_load,
     reset_record_before_load,
     select_nparallel,
     select_node,
     get_selected_project,
+    get_selection_state,
     reset_execution_before_load,
     reset_persistent_before_load,
     reset_queue_before_load,
     reset_remote_before_load,
+    select_activation,
     select_cluster,
     select_execution,
+    select_memory_cache,
     select_persistent,
     select_project,
     select_queue,
+    select_queue_overrides,
+    select_queue_routing,
+    select_worker_pools,
     select_record,
     select_remote,
     select_subproject,
+    set_selection_state,
 )
 from .tools import define_tools
 
@@ -71,18 +81,31 @@ class StageBlock:
 _tools_loaded = False
 
 
+def _yaml_load(handle) -> Any:
+    # PyYAML is imported only when a YAML file is actually read
+    import yaml  # type: ignore
+
+    return yaml.safe_load(handle)
+
+
 # Tool definition
 def load_tools() -> dict:
     """
-    Load tool definitions from tools.yaml and register them inside seamless_config.tools.
+    Load tool definitions and register them inside seamless_config.tools.
+
+    The definitions are read from the generated _tools_data module, which is
+    checked against tools.yaml. If tools.yaml was edited without regenerating
+    the module (see write_tools_data), tools.yaml is parsed instead.
     """
     global _tools_loaded
     if _tools_loaded:
         return
     _tools_loaded = True
     tools_file = Path(__file__).with_name(TOOLS_FILENAME)
-    with tools_file.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+    data = _load_tools_data(tools_file)
+    if data is None:
+        with tools_file.open("r", encoding="utf-8") as handle:
+            data = _yaml_load(handle)
     if data is None:
         data = {}
     if not isinstance(data, dict):
@@ -94,6 +117,43 @@ def load_tools() -> dict:
     return data
 
 
+def _tools_file_checksum(tools_file: Path) -> str:
+    import hashlib
+
+    return hashlib.sha256(tools_file.read_bytes()).hexdigest()
+
+
+def _load_tools_data(tools_file: Path) -> dict | None:
+    try:
+        from ._tools_data import SOURCE_SHA256, TOOLS
+    except ImportError:
+        return None
+    if SOURCE_SHA256 != _tools_file_checksum(tools_file):
+        return None
+    return TOOLS
+
+
+def write_tools_data() -> Path:
+    """
+    Regenerate the _tools_data module from tools.yaml.
+    Run "python -m seamless_config.config_files" after editing tools.yaml.
+    """
+    import pprint
+
+    tools_file = Path(__file__).with_name(TOOLS_FILENAME)
+    with tools_file.open("r", encoding="utf-8") as handle:
+        data = _yaml_load(handle)
+    module_file = Path(__file__).with_name("_tools_data.py")
+    content = (
+        f"# Generated from {TOOLS_FILENAME} by seamless_config.config_files.write_tools_data.\n"
+        "# Do not edit; edit tools.yaml and regenerate instead.\n\n"
+        f'SOURCE_SHA256 = "{_tools_file_checksum(tools_file)}"\n\n'
+        f"TOOLS = {pprint.pformat(data, sort_dicts=False, width=88)}\n"
+    )
+    module_file.write_text(content, encoding="utf-8")
+    return module_file
+
+
 # Command language
 def _handle_cluster(value: Any, source: Path) -> None:
     if not isinstance(value, str) and value is not None:
@@ -155,6 +215,49 @@ def _handle_node(value: Any, source: Path) -> None:
     select_node(value, source="command")
 
 
+def _handle_memory_cache(value: Any, source: Path) -> None:
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, (int, str))
+    ):
+        raise ValueError(
+            f"{source}: 'memory_cache' command expects a size (e.g. 4GB) or null"
+        )
+    try:
+        select_memory_cache(value, source="command")
+    except ValueError as exc:
+        raise ValueError(f"{source}: {exc}") from None
+
+
+def _handle_activation(value: Any, source: Path) -> None:
+    if not isinstance(value, str):
+        raise ValueError(f"{source}: 'activation' command expects a string value")
+    select_activation(value, source="command")
+
+
+def _handle_queue_overrides(value: Any, source: Path) -> None:
+    if value is not None and not isinstance(value, dict):
+        raise ValueError(
+            f"{source}: 'queue_overrides' command expects a mapping of queue fields or null"
+        )
+    try:
+        select_queue_overrides(value, source="command")
+    except ValueError as exc:
+        raise ValueError(f"{source}: {exc}") from None
+
+
+def _handle_queue_routing(value: Any, source: Path) -> None:
+    if not isinstance(value, bool):
+        raise ValueError(f"{source}: 'queue_routing' command expects a boolean value")
+    select_queue_routing(value, source="command")
+
+
+def _handle_worker_pools(value: Any, source: Path) -> None:
+    try:
+        select_worker_pools(value, source="command")
+    except ValueError as exc:
+        raise ValueError(f"{source}: {exc}") from None
+
+
 def _handle_clusters(value: Any, source: Path) -> None:
     if not isinstance(value, dict):
         raise ValueError(f"{source}: 'clusters' command expects a mapping")
@@ -172,6 +275,11 @@ COMMAND_SPECS: dict[str, CommandSpec] = {
     "subproject": CommandSpec(handler=_handle_subproject),
     "nparallel": CommandSpec(handler=_handle_nparallel),
     "node": CommandSpec(handler=_handle_node),
+    "memory_cache": CommandSpec(handler=_handle_memory_cache),
+    "activation": CommandSpec(handler=_handle_activation),
+    "queue_overrides": CommandSpec(handler=_handle_queue_overrides),
+    "queue_routing": CommandSpec(handler=_handle_queue_routing),
+    "worker_pools": CommandSpec(handler=_handle_worker_pools),
     "clusters": CommandSpec(handler=_handle_clusters, priority=True),
 }
 
@@ -190,7 +298,7 @@ def _load_clusters() -> dict[str, Any]:
     for clusters_path in [clusters_path_yaml] + list(sub_yamls):
         if clusters_path.is_file():
             with clusters_path.open("r", encoding="utf-8") as handle:
-                data.update(yaml.safe_load(handle))
+                data.update(_yaml_load(handle))
     if data is None:
         data = {}
     if not isinstance(data, dict):
@@ -212,6 +320,11 @@ def load_config_files() -> None:
     reset_remote_before_load()
     reset_record_before_load()
     reset_node_before_load()
+    reset_memory_cache_before_load()
+    reset_activation_before_load()
+    reset_queue_overrides_before_load()
+    reset_queue_routing_before_load()
+    reset_worker_pools_before_load()
     load_tools()
     if _load_seamless_cache_config():
         return
@@ -229,6 +342,40 @@ def load_config_files() -> None:
         command.execute()
 
 
+def get_config_snapshot() -> dict[str, Any]:
+    """
+    Return the outcome of load_config_files() as JSON-serializable data:
+    the cluster definitions and all selections.
+    """
+    return {"clusters": _clusters, "selection": get_selection_state()}
+
+
+def apply_config_snapshot(snapshot: dict[str, Any]) -> None:
+    """Apply a snapshot from get_config_snapshot() instead of load_config_files()."""
+    global _clusters
+    load_tools()
+    _clusters = snapshot["clusters"]
+    register_clusters(_clusters)
+    set_selection_state(snapshot["selection"])
+
+
+def find_stages() -> list[str]:
+    """Return the names of all 'stage <name>' blocks in the configuration files."""
+    stages: list[str] = []
+
+    def scan(entries: Iterable[tuple[Path, Any]]) -> None:
+        for source, entry in entries:
+            name, argument = _parse_command_entry(entry, source)
+            if name != "stage" or not isinstance(argument, StageBlock):
+                continue
+            if argument.stage not in stages:
+                stages.append(argument.stage)
+            scan([(source, nested) for nested in argument.entries])
+
+    scan(_collect_command_entries())
+    return stages
+
+
 def _load_seamless_cache_config() -> bool:
     from . import get_seamless_cache
     from .select import select_execution, select_persistent
@@ -287,7 +434,7 @@ def _collect_command_entries() -> list[tuple[Path, Any]]:
 
 def _read_yaml_list(path: Path) -> list[Any]:
     with path.open("r", encoding="utf-8") as handle:
-        content = yaml.safe_load(handle)
+        content = _yaml_load(handle)
     if not isinstance(content, list):
         raise ValueError(
             f"{path}: expected a YAML list of commands. Example:\n{COMMAND_LIST_EXAMPLE}"
@@ -367,3 +514,7 @@ def _extract_command_name(entry: Any) -> str | None:
         if isinstance(key, str):
             return key
     return None
+
+
+if __name__ == "__main__":
+    print(write_tools_data())
@@ -0,0 +1,330 @@
+"""Per-user broker for resolved configuration and launch payloads.
+
+'seamless-init --daemon' runs serve(). The daemon listens on a Unix socket in
+a private per-user directory, and answers newline-delimited JSON requests:
+
+- {"op": "ping"}
+- {"op": "resolve", "workdir": ..., "home": ..., "selection": {...}}:
+  evaluate the configuration files of workdir, starting from the given
+  selections, and return the result (see config_files.get_config_snapshot).
+  Results are cached until one of the configuration files changes.
+- {"op": "launch", "config": {...}, "refresh": false}: return the payload of
+  remote_http_launcher.run(config). Payloads are cached per launch dict, and
+  only handed out again while their server still accepts connections: servers
+  exit after a period of inactivity.
+
+set_stage() and launch() use the daemon when it is running, and otherwise do
+the work in-process. A daemon that does not answer in time counts as not
+running.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any
+
+# Path of the daemon socket. If set to an empty string, the daemon is not used.
+SOCKET_ENV = "SEAMLESS_CONFIG_DAEMON_SOCKET"
+SOCKET_NAME = "daemon.sock"
+REQUEST_TIMEOUT = 5.0
+# Connecting to a live daemon is immediate; a launch can take minutes
+# (see 'timeout' in tools.yaml)
+CONNECT_TIMEOUT = 1.0
+LAUNCH_TIMEOUT = 900.0
+# Timeout of the check that the server of a cached launch payload is still up
+ALIVE_TIMEOUT = 1.0
+
+
+def _node_cache_dir(*, create: bool = False) -> str | None:
+    """
+    Private per-user cache directory on this node, or None if unavailable.
+
+    Unless create, the directory is not created, and None is returned
+    if it does not exist.
+    """
+    import getpass
+    import tempfile
+
+    try:
+        directory = os.path.join(
+            tempfile.gettempdir(), f"seamless-config-{getpass.getuser()}"
+        )
+        if create:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        elif not os.path.isdir(directory):
+            return None
+        if hasattr(os, "getuid") and os.stat(directory).st_uid != os.getuid():
+            return None
+    except Exception:
+        return None
+    return directory
+
+
+def socket_path(*, create: bool = False) -> str | None:
+    """
+    Return the path of the daemon socket, or None if the daemon is disabled
+    or was never started. With create, the socket directory is created.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path is not None:
+        return path or None
+    directory = _node_cache_dir(create=create)
+    if directory is None:
+        return None
+    return os.path.join(directory, SOCKET_NAME)
+
+
+def request(
+    message: dict[str, Any],
+    *,
+    timeout: float | None = REQUEST_TIMEOUT,
+    connect_timeout: float | None = None,
+    path: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    Send a request to the daemon and return its response, or None if no
+    daemon is listening, or it did not answer within the timeout.
+
+    connect_timeout defaults to timeout.
+    """
+    if path is None:
+        path = socket_path()
+    if path is None or not os.path.exists(path):
+        return None
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout if connect_timeout is None else connect_timeout)
+            sock.connect(path)
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _home() -> str:
+    return os.environ.get("HOME") or os.path.expanduser("~")
+
+
+def resolve_config() -> bool:
+    """
+    Apply the configuration of the current workdir as resolved by the daemon.
+
+    Returns False if no daemon is running or it could not resolve the
+    configuration; the caller then runs load_config_files() itself.
+    """
+    from . import get_seamless_cache, get_workdir
+    from .config_files import apply_config_snapshot
+    from .select import get_selection_state
+
+    if get_seamless_cache() is not None:
+        return False
+    response = request(
+        {
+            "op": "resolve",
+            "workdir": os.path.abspath(get_workdir()),
+            "home": _home(),
+            "selection": get_selection_state(),
+        }
+    )
+    if response is None or not response.get("ok"):
+        return False
+    try:
+        apply_config_snapshot(response["result"])
+    except Exception:
+        return False
+    return True
+
+
+def launch(config: dict[str, Any], *, refresh: bool = False) -> dict[str, Any]:
+    """
+    Launch a server (or find it running) and return the launcher payload.
+
+    The daemon is asked first, so that processes on the same host share
+    launches. Without a daemon, or if it does not answer within
+    LAUNCH_TIMEOUT, remote_http_launcher.run is called directly.
+    """
+    response = request(
+        {"op": "launch", "config": config, "refresh": refresh},
+        timeout=LAUNCH_TIMEOUT,
+        connect_timeout=CONNECT_TIMEOUT,
+    )
+    if response is not None:
+        if not response.get("ok"):
+            raise RuntimeError(f"seamless-config daemon: {response.get('error')}")
+        return response["result"]
+    import remote_http_launcher
+
+    return remote_http_launcher.run(config)
+
+
+def _is_alive(payload: dict[str, Any]) -> bool:
+    """Whether the server of a launch payload still accepts connections."""
+    import socket
+
+    hostname, port = payload.get("hostname"), payload.get("port")
+    if hostname is None or port is None:
+        return False
+    try:
+        with socket.create_connection((hostname, port), timeout=ALIVE_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+def _config_fingerprint(workdir: str) -> list:
+    """Modification times and sizes of all files that load_config_files() may read."""
+    import glob
+    from .config_files import CONFIG_FILENAMES
+
+    paths = []
+    directory = os.path.realpath(workdir)
+    while True:
+        for filename in CONFIG_FILENAMES:
+            paths.append(os.path.join(directory, filename))
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    seamless_dir = os.path.join(_home(), ".seamless")
+    paths.append(os.path.join(seamless_dir, "clusters.yaml"))
+    clusters_dir = os.path.join(seamless_dir, "clusters")
+    paths.append(clusters_dir)
+    paths.extend(sorted(glob.glob(os.path.join(clusters_dir, "*.yaml"))))
+
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            fingerprint.append(None)
+        else:
+            fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return fingerprint
+
+
+class ConfigDaemon:
+    """The state of the daemon: resolved configurations and launch payloads."""
+
+    def __init__(self):
+        self._resolved: dict[str, tuple[list, dict]] = {}
+        self._resolve_lock = threading.Lock()
+        self._payloads: dict[str, dict] = {}
+        self._launch_locks: dict[str, threading.Lock] = {}
+        self._launch_locks_lock = threading.Lock()
+
+    def handle(self, message: dict[str, Any]) -> Any:
+        op = message.get("op")
+        if op == "ping":
+            return {"pid": os.getpid()}
+        if op == "resolve":
+            return self.resolve(
+                message["workdir"], message["home"], message["selection"]
+            )
+        if op == "launch":
+            return self.launch(message["config"], bool(message.get("refresh")))
+        raise ValueError(f"Unknown operation '{op}'")
+
+    def resolve(self, workdir: str, home: str, selection: dict) -> dict:
+        import seamless_config
+        from .config_files import get_config_snapshot, load_config_files
+        from .select import set_selection_state
+
+        if home != _home():
+            raise ValueError("The daemon runs with a different HOME")
+        key = json.dumps([workdir, selection], sort_keys=True)
+        fingerprint = _config_fingerprint(workdir)
+        with self._resolve_lock:
+            cached = self._resolved.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            seamless_config.set_workdir(workdir)
+            set_selection_state(selection)
+            load_config_files()
+            # Round-trip through JSON: a private copy that is known to serialize
+            snapshot = json.loads(json.dumps(get_config_snapshot()))
+            self._resolved[key] = (fingerprint, snapshot)
+            return snapshot
+
+    def launch(self, config: dict, refresh: bool = False) -> dict:
+        import remote_http_launcher
+        from .ports import renew_lease
+
+        key = json.dumps(config, sort_keys=True)
+        with self._launch_locks_lock:
+            lock = self._launch_locks.setdefault(key, threading.Lock())
+        # Concurrent requests for the same server wait for a single launch
+        with lock:
+            payload = None if refresh else self._payloads.get(key)
+            if payload is not None and not _is_alive(payload):
+                # The server exited; remote_http_launcher relaunches it
+                payload = None
+            if payload is None:
+                payload = remote_http_launcher.run(config)
+                self._payloads[key] = payload
+            else:
+                # The running server keeps its ports
+                renew_lease(config)
+            return payload
+
+
+def make_server(path: str | None = None):
+    """Create the daemon server on its Unix socket (see serve)."""
+    import socketserver
+
+    if path is None:
+        path = socket_path(create=True)
+    if path is None:
+        raise RuntimeError("The seamless-config daemon is disabled or has no socket path")
+    if os.path.exists(path):
+        if request({"op": "ping"}, path=path) is not None:
+            raise RuntimeError(f"A seamless-config daemon is already listening on {path}")
+        os.unlink(path)
+    daemon = ConfigDaemon()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    result = daemon.handle(json.loads(line))
+                    response = {"ok": True, "result": result}
+                except Exception as exc:
+                    response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+                self.wfile.flush()
+
+    # The socket is only accessible to the user
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+    server.daemon = daemon
+    return server
+
+
+def serve(path: str | None = None) -> None:
+    """Run the daemon in the foreground until interrupted."""
+    server = make_server(path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(server.server_address)
+        except OSError:
+            pass
+
+
+__all__ = ["socket_path", "request", "resolve_config", "launch", "serve"]
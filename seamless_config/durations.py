@@ -0,0 +1,178 @@
+"""History of observed task durations, fed to the daskserver as hints.
+
+When a cluster defines 'task_durations', the durations of tasks that were
+observed in previous runs are recorded in ~/.seamless/task-durations.json,
+per project and stage. Entries are keyed by Dask task prefix (the name part of
+a task key, see dask.utils.key_split), because that is how the scheduler looks
+up distributed.scheduler.default-task-durations. Each entry is an exponentially
+weighted moving average of the observed durations. configure_daskserver passes
+the most recently seen entries to the daskserver, so that Dask's scaling and
+work stealing do not have to wait until the first tasks of new code have finished.
+
+seamless-config does not observe tasks itself. Durations are recorded by the
+code that runs them: record_scheduler_durations(client) reads the averages
+of the scheduler's task prefixes, typically at the end of a run, before the
+client is closed. record_durations can be fed from any other source, as long
+as it is keyed by task prefix.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+HISTORY_FILENAME = "task-durations.json"
+# Weight of a new observation in the moving average
+DEFAULT_ALPHA = 0.3
+# Entries per project and stage that are kept in the history file
+MAX_HISTORY_ENTRIES = 10000
+
+# (path, mtime_ns, size) and contents of the history file, as last read
+_read_cache: tuple[tuple, dict] | None = None
+
+
+def history_file() -> str:
+    home_dir = os.environ.get("HOME") or os.path.expanduser("~")
+    return os.path.join(home_dir, ".seamless", HISTORY_FILENAME)
+
+
+def history_scope(project: str | None, stage: str | None) -> str:
+    """The part of the history that belongs to a project and stage."""
+    scope = project or ""
+    if stage is not None:
+        scope += "/STAGE-" + stage
+    return scope
+
+
+def record_durations(
+    durations: dict[str, float],
+    *,
+    project: str | None = None,
+    stage: str | None = None,
+    alpha: float = DEFAULT_ALPHA,
+) -> None:
+    """
+    Record observed task durations (in seconds), keyed by Dask task prefix.
+
+    By default, project and stage are the current selections.
+    """
+    from ._lockfile import LockedJsonFile
+    from .select import get_selected_project, get_stage
+
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+    for prefix, duration in durations.items():
+        if not isinstance(prefix, str):
+            raise ValueError("Task durations must be keyed by task prefix strings")
+        if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+            raise ValueError(f"Task duration of {prefix} must be a number")
+        if duration < 0:
+            raise ValueError(f"Task duration of {prefix} must not be negative")
+    if not durations:
+        return
+    if project is None:
+        project = get_selected_project()
+    if stage is None:
+        stage = get_stage()
+    scope = history_scope(project, stage)
+
+    now = time.time()
+    history = LockedJsonFile(history_file())
+    with history as data:
+        entries = data.setdefault(scope, {})
+        for prefix, duration in durations.items():
+            entry = entries.get(prefix)
+            if entry is None:
+                entry = {"duration": float(duration), "count": 0}
+                entries[prefix] = entry
+            else:
+                entry["duration"] = (
+                    alpha * duration + (1 - alpha) * entry["duration"]
+                )
+            entry["count"] += 1
+            entry["seen"] = now
+        if len(entries) > MAX_HISTORY_ENTRIES:
+            oldest = sorted(entries, key=lambda prefix: entries[prefix]["seen"])
+            for prefix in oldest[: len(entries) - MAX_HISTORY_ENTRIES]:
+                del entries[prefix]
+        history.save(data)
+
+
+def record_duration(prefix: str, duration: float, **kwargs) -> None:
+    """Record one observed task duration (see record_durations)."""
+    record_durations({prefix: duration}, **kwargs)
+
+
+def _scheduler_durations(dask_scheduler) -> dict[str, float]:
+    durations = {}
+    for name, prefix in dask_scheduler.task_prefixes.items():
+        # Negative (-1) until a task of the prefix has finished
+        duration = prefix.duration_average
+        if duration is not None and duration >= 0:
+            durations[name] = duration
+    return durations
+
+
+def record_scheduler_durations(client, **kwargs) -> dict[str, float]:
+    """
+    Record the average task durations that the Dask scheduler has observed.
+
+    client is a distributed.Client (or a SeamlessDaskClient, via its .client).
+    Returns the recorded durations (see record_durations for the kwargs).
+    """
+    client = getattr(client, "client", client)
+    if client is None:
+        # A lazy Seamless Dask client that never connected: nothing was run
+        return {}
+    durations = client.run_on_scheduler(_scheduler_durations)
+    record_durations(durations, **kwargs)
+    return durations
+
+
+def _read_history() -> dict[str, Any]:
+    global _read_cache
+    import json
+
+    path = history_file()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+    if _read_cache is not None and _read_cache[0] == signature:
+        return _read_cache[1]
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    _read_cache = signature, data
+    return data
+
+
+def get_duration_hints(
+    project: str | None, stage: str | None, *, max_entries: int | None = None
+) -> dict[str, float]:
+    """
+    Return the learned durations (in seconds) of a project and stage,
+    keyed by task prefix, limited to the most recently seen entries.
+    """
+    entries = _read_history().get(history_scope(project, stage), {})
+    items = sorted(
+        entries.items(), key=lambda item: item[1].get("seen", 0), reverse=True
+    )
+    if max_entries is not None:
+        items = items[:max_entries]
+    return {prefix: entry["duration"] for prefix, entry in sorted(items)}
+
+
+__all__ = [
+    "history_file",
+    "record_durations",
+    "record_duration",
+    "record_scheduler_durations",
+    "get_duration_hints",
+]
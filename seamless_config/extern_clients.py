@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import warnings
 from typing import Any, Dict, List
 
-from .tools import configure_hashserver
-
-
 def collect_remote_clients(cluster: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     Collect extern and launched database/buffer clients for a given cluster.
@@ -42,12 +41,89 @@ def collect_remote_clients(cluster: str) -> Dict[str, List[Dict[str, Any]]]:
     for info in buffer_remote.inspect_extern_clients():
         buffer_entries.append(copy_entry(info))
 
+    shared_directories = set()
     for info in buffer_remote.inspect_launched_clients():
         if info.get("cluster") != cluster:
             continue
-        buffer_entries.append(copy_entry(info))
+        entry = copy_entry(info)
+        shared_directory = _shared_buffer_directory(cluster, info)
+        if shared_directory and shared_directory not in shared_directories:
+            # bufferdir is mounted on all nodes: let workers read directly
+            shared_directories.add(shared_directory)
+            buffer_entries.append(
+                {"readonly": True, "remote_directory": shared_directory}
+            )
+        buffer_entries.append(entry)
 
-    return {"database": database_entries, "buffer": buffer_entries}
+    result: Dict[str, Any] = {"database": database_entries, "buffer": buffer_entries}
+    from dataclasses import asdict
+    from .cluster import get_cluster
+
+    try:
+        clus = get_cluster(cluster)
+    except KeyError:
+        clus = None
+    if clus is not None:
+        if clus.client_probing is not None:
+            result["probe"] = asdict(clus.client_probing)
+        if clus.connect_policy is not None:
+            result["connect_policy"] = asdict(clus.connect_policy)
+    return result
+
+
+def remote_clients_key() -> tuple:
+    """
+    Return a hashable summary of the extern and launched database/buffer
+    clients, i.e. of what collect_remote_clients collects from seamless_remote.
+
+    The rest of its input is the cluster definitions, and the configure cache
+    is cleared when these change.
+    """
+    from seamless_remote import buffer_remote, database_remote
+
+    return tuple(
+        tuple(tuple(sorted(info.items())) for info in inspect())
+        for inspect in (
+            database_remote.inspect_extern_clients,
+            database_remote.inspect_launched_clients,
+            buffer_remote.inspect_extern_clients,
+            buffer_remote.inspect_launched_clients,
+        )
+    )
+
+
+def _shared_buffer_directory(cluster: str, info: dict[str, Any]) -> str:
+    """
+    Return the buffer directory of a launched hashserver client if the bufferdir
+    of its frontend is declared as a shared filesystem, else an empty string.
+
+    The directory is the workdir of the launched server, as reported by the
+    client itself (remote_directory). Read-only clients do not report it.
+    """
+    from urllib.parse import urlparse
+    from .cluster import get_cluster
+
+    directory = info.get("remote_directory")
+    if not directory:
+        return ""
+    try:
+        clus = get_cluster(cluster)
+    except KeyError:
+        return ""
+    hostname = urlparse(info.get("remote_url") or "").hostname
+    frontends = [
+        frontend for frontend in clus.frontends if frontend.hashserver is not None
+    ]
+    for frontend in frontends:
+        if hostname in (frontend.hostname, frontend.ssh_hostname):
+            break
+    else:
+        if not frontends:
+            return ""
+        frontend = frontends[0]
+    if not frontend.hashserver.shared_filesystem:
+        return ""
+    return directory
 
 
 def set_remote_clients(
@@ -63,11 +139,15 @@ def set_remote_clients(
     if _config._initialized:
         raise RuntimeError("Cannot set remote clients after initialization")
     _config._remote_clients_set = True
+    _stop_probers()
 
     database = clients.get("database", [])
     database_names = []
+    database_candidates = []
     buffer = clients.get("buffer", [])
     buffer_names = []
+    buffer_candidates = []
+    probe = clients.get("probe")
 
     for idx, entry in enumerate(database):
         readonly = entry.get("readonly", True)
@@ -82,10 +162,12 @@ def set_remote_clients(
             name, "database", url=url, readonly=readonly
         )
         database_names.append(name)
+        database_candidates.append((name, "url", url))
 
+    if probe is not None:
+        database_names = _probe_clients(database_candidates, probe)
     database_remote.activate(no_main=True, extern_clients=database_names)
 
-    buffer_names = []
     for idx, entry in enumerate(buffer):
         readonly = entry.get("readonly", True)
         if in_remote:
@@ -96,22 +178,85 @@ def set_remote_clients(
         else:
             url = entry.get("url")
             directory = entry.get("directory")
+            if (
+                url is None
+                and directory is None
+                and entry.get("remote_directory") is not None
+            ):
+                # Shared-filesystem entry, only reachable from inside the cluster
+                continue
         name = f"extern-buffer-{idx}"
         if directory is not None and url is None:
             buffer_remote.define_extern_client(
                 name, "bufferfolder", directory=directory, readonly=True
             )
+            buffer_candidates.append((name, "directory", directory))
         elif url is not None:
             buffer_remote.define_extern_client(
                 name, "hashserver", url=url, readonly=readonly
             )
+            buffer_candidates.append((name, "url", url))
         else:
             raise ValueError("Buffer client entry requires 'url' or 'directory'")
         buffer_names.append(name)
 
+    if probe is not None:
+        buffer_names = _probe_clients(buffer_candidates, probe)
     buffer_remote.activate(no_main=True, extern_clients=buffer_names)
 
 
+def _stop_probers() -> None:
+    import sys
+
+    probe_module = sys.modules.get("seamless_config.probe")
+    if probe_module is not None:
+        probe_module.stop_probers()
+
+
+def _probe_clients(candidates, probe: Dict[str, Any]) -> List[str]:
+    """
+    Order clients by probed health, locality and latency.
+    If probe defines a reprobe_interval, keep re-probing in the background and
+    record which clients are unhealthy (see probe.get_unhealthy_clients).
+    """
+    from .probe import _record_health, order_clients, start_prober
+
+    order, latencies = order_clients(candidates, probe["timeout"])
+    _record_health(latencies)
+    interval = probe.get("reprobe_interval")
+    if interval:
+        start_prober(candidates, timeout=probe["timeout"], interval=interval)
+    return order
+
+
+FILE_PREFIX = "@"
+
+_decoded_remote_clients: dict[str, Any] = {}
+
+
+def decode_remote_clients(value: str) -> Dict[str, Any]:
+    """
+    Decode a SEAMLESS_REMOTE_CLIENTS value: either JSON, or "@<path>" of a
+    file that contains the JSON. The file form keeps the environment of
+    the workers small; it is written by the launch script that sets the
+    variable, not by seamless-config. Results are cached per process.
+    """
+    result = _decoded_remote_clients.get(value)
+    if result is not None:
+        return result
+    if value.startswith(FILE_PREFIX):
+        path = os.path.expanduser(value[len(FILE_PREFIX) :])
+        with open(path, "r", encoding="utf-8") as handle:
+            data = handle.read()
+    else:
+        data = value
+    result = json.loads(data)
+    if not isinstance(result, dict):
+        raise ValueError("Remote clients definition must be a JSON object")
+    _decoded_remote_clients[value] = result
+    return result
+
+
 def set_remote_clients_from_env(include_dask: bool) -> bool:
     from . import get_seamless_cache
 
@@ -121,16 +266,124 @@ def set_remote_clients_from_env(include_dask: bool) -> bool:
     if env_remote_clients is None:
         return False
     try:
-        remote_clients = json.loads(env_remote_clients)
+        remote_clients = decode_remote_clients(env_remote_clients)
         set_remote_clients(remote_clients, in_remote=True)
         if include_dask:
-            _configure_dask_client_from_env()
-    except Exception:
-        pass
+            _configure_dask_client_from_env(remote_clients.get("connect_policy"))
+    except Exception as exc:
+        # Recorded in seamless_config.retry.get_connect_metrics()
+        warnings.warn(
+            f"Could not set remote clients from SEAMLESS_REMOTE_CLIENTS: {type(exc).__name__}: {exc}"
+        )
     return True
 
 
-def _configure_dask_client_from_env() -> None:
+class LazySeamlessDaskClient:
+    """
+    Proxy for a SeamlessDaskClient that connects to the scheduler on first use.
+
+    The connection is created once and shared by all threads. Each connection
+    attempt holds a lock, which is released between retries. Attribute access
+    is forwarded to the connected client. Until then, .client and the
+    attributes that seamless-dask inspects when it registers or shuts down a
+    client are None, so that these do not connect. Closing the proxy,
+    directly or as a context manager, does not connect either; a closed proxy
+    reconnects on next use.
+    """
+
+    def __init__(
+        self,
+        scheduler_address: str,
+        worker_count: int,
+        policy: Dict[str, Any] | None = None,
+    ):
+        self._scheduler_address = scheduler_address
+        self._worker_count = worker_count
+        self._policy = policy
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    @property
+    def client(self):
+        """The distributed.Client of the connection, or None before first use."""
+        client = self._client
+        if client is None:
+            return None
+        return client.client
+
+    # Only set on seamless-dask clients with a dummy scheduler
+    _dummy_dask_client = None
+    _dummy_scheduler_handle = None
+
+    def _connect(self):
+        client = self._client
+        if client is not None:
+            return client
+        from .retry import call_with_retry
+
+        try:
+            return call_with_retry(self._connect_once, self._policy, "dask_client")
+        except Exception as exc:
+            # Recorded in seamless_config.retry.get_connect_metrics()
+            warnings.warn(
+                f"Could not connect to the Dask scheduler at {self._scheduler_address}: {type(exc).__name__}: {exc}"
+            )
+            raise
+
+    def _connect_once(self):
+        with self._lock:
+            if self._client is None:
+                from distributed import Client as DistributedClient
+                from seamless_dask.client import SeamlessDaskClient
+
+                dask_client = DistributedClient(
+                    self._scheduler_address,
+                    timeout="10s",
+                    set_as_default=False,
+                )
+                self._client = SeamlessDaskClient(
+                    dask_client,
+                    worker_plugin_workers=self._worker_count,
+                )
+            return self._client
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._connect(), attr)
+
+    def close(self) -> None:
+        """Close the scheduler connection, if it was made."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is None:
+            return
+        close = getattr(client, "close", None)
+        if close is None:
+            close = client.client.close
+        close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        state = "connected" if self.connected else "not connected"
+        return f"<LazySeamlessDaskClient {self._scheduler_address} ({state})>"
+
+
+# One lazy client per scheduler address, worker count and connect policy,
+# reused by repeated initializations
+_lazy_dask_clients: dict[tuple[str, int, str], LazySeamlessDaskClient] = {}
+
+
+def _configure_dask_client_from_env(policy: Dict[str, Any] | None = None) -> None:
     try:
         from seamless import is_worker
 
@@ -151,20 +404,13 @@ def _configure_dask_client_from_env() -> None:
     if get_seamless_dask_client() is not None:
         return
     try:
-        from distributed import Client as DistributedClient
-        from seamless_dask.client import SeamlessDaskClient
-
-        try:
-            worker_count = int(os.environ.get("SEAMLESS_DASK_WORKERS", "1") or 1)
-        except Exception:
-            worker_count = 1
-        dask_client = DistributedClient(
-            scheduler_address, timeout="10s", set_as_default=False
-        )
-        sd_client = SeamlessDaskClient(
-            dask_client,
-            worker_plugin_workers=worker_count,
-        )
-        set_seamless_dask_client(sd_client)
+        worker_count = int(os.environ.get("SEAMLESS_DASK_WORKERS", "1") or 1)
     except Exception:
-        pass
+        worker_count = 1
+    # The scheduler handshake is deferred until the first submission
+    key = (scheduler_address, worker_count, json.dumps(policy, sort_keys=True))
+    sd_client = _lazy_dask_clients.get(key)
+    if sd_client is None:
+        sd_client = LazySeamlessDaskClient(scheduler_address, worker_count, policy)
+        _lazy_dask_clients[key] = sd_client
+    set_seamless_dask_client(sd_client)
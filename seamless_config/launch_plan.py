@@ -0,0 +1,153 @@
+"""Precomputation and deduplication of server launches across stages.
+
+plan_launches() evaluates the configuration once for every stage that has a
+'stage <name>' block, and computes the launch dicts of the servers that each
+stage needs. Launch dicts with the same key (see the key_template in
+tools.yaml) describe the same server and are merged. prelaunch() then starts the
+unique servers in parallel, so that later set_stage() calls find them running.
+
+The jobserver is not planned: its launch parameters contain the URLs of the
+live buffer and database clients, which are only known after they have been
+launched.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable
+
+from .config_files import find_stages
+
+
+def _plan_stage(mode: str) -> list[tuple[str, dict]]:
+    """Launch dicts needed by the currently loaded stage, as (tool, config) tuples."""
+    from .select import (
+        check_remote_redundancy,
+        get_execution,
+        get_persistent,
+        get_selected_cluster,
+        get_selected_project,
+    )
+    from .tools import (
+        configure_daskserver,
+        configure_database,
+        configure_hashserver,
+        configure_pure_daskserver,
+    )
+
+    cluster = get_selected_cluster()
+    if cluster is None or get_selected_project() is None:
+        return []
+    from .cluster import get_cluster
+
+    clus = get_cluster(cluster)
+    persistent = get_persistent()
+    execution = get_execution()
+    result: list[tuple[str, dict]] = []
+    if persistent:
+        if any(frontend.hashserver is not None for frontend in clus.frontends):
+            result.append(("hashserver", configure_hashserver(mode)))
+        if any(frontend.database is not None for frontend in clus.frontends):
+            result.append(("database", configure_database(mode)))
+    if execution == "remote" and check_remote_redundancy(cluster) == "daskserver":
+        if persistent:
+            result.append(("daskserver", configure_daskserver()))
+        else:
+            result.append(("pure_daskserver", configure_pure_daskserver()))
+    return result
+
+
+def plan_launches(
+    stages: Iterable[str | None | tuple[str | None, str | None]] | None = None,
+    *,
+    mode: str = "rw",
+) -> list[dict[str, Any]]:
+    """
+    Compute the unique server launches needed by a set of stages.
+
+    stages contains stage names, or (stage, substage) tuples; None stands for
+    the default (unnamed) stage. By default, the default stage and all stages
+    found by find_stages() are planned.
+
+    Returns a list of dicts with the keys:
+    - "tool": hashserver, database, daskserver or pure_daskserver
+    - "key": the launch key
+    - "stages": the (stage, substage) tuples that use this server
+    - "config": the launch dict, as passed to remote-http-launcher
+
+    The configuration is re-evaluated for each stage. Afterwards, the stage
+    selection is restored and the configuration is re-evaluated for it.
+    """
+    import seamless_config
+    from .config_files import load_config_files
+    from .select import get_stage, get_substage, select_stage, select_substage
+
+    if stages is None:
+        stages = [None, *find_stages()]
+
+    old_stage, old_substage = get_stage(), get_substage()
+    plan: dict[tuple[str, str], dict[str, Any]] = {}
+    try:
+        for stage_spec in stages:
+            if isinstance(stage_spec, tuple):
+                stage, substage = stage_spec
+            else:
+                stage, substage = stage_spec, None
+            select_stage(stage)
+            select_substage(substage)
+            load_config_files()
+            for tool, config in _plan_stage(mode):
+                key = config["key"]
+                entry = plan.get((tool, key))
+                if entry is None:
+                    entry = {"tool": tool, "key": key, "stages": [], "config": config}
+                    plan[tool, key] = entry
+                entry["stages"].append((stage, substage))
+    finally:
+        select_stage(old_stage)
+        select_substage(old_substage)
+        if seamless_config._initialized:
+            load_config_files()
+    return list(plan.values())
+
+
+def prelaunch(
+    plan: list[dict[str, Any]], *, max_workers: int | None = None
+) -> dict[str, Any]:
+    """
+    Launch all servers of a plan in parallel, using remote-http-launcher
+    (through the seamless-config daemon, if it is running).
+
+    Returns a dict that maps each launch key to the launcher payload, or to the
+    exception that was raised. A failed launch does not stop the others; it is
+    raised again when the stage that needs the server is activated.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .daemon import launch as launch_server
+    from .pure_daskserver import _freeze_value, _launcher_cache
+
+    if not plan:
+        return {}
+
+    def launch(entry):
+        print(f"Launch {entry['tool']} {entry['key']}...", file=sys.stderr)
+        payload = launch_server(entry["config"])
+        if entry["tool"] == "pure_daskserver":
+            _launcher_cache[_freeze_value(entry["config"])] = payload
+        return payload
+
+    results: dict[str, Any] = {}
+    if max_workers is None:
+        max_workers = min(len(plan), 16)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {entry["key"]: executor.submit(launch, entry) for entry in plan}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as exc:
+                results[key] = exc
+    return results
+
+
+__all__ = ["find_stages", "plan_launches", "prelaunch"]
@@ -0,0 +1,52 @@
+"""When the servers behind the remote clients are launched ('activation' command).
+
+change_stage() always activates the buffer, database and job delegation
+remotes right away. Activation only registers the clients: each client launches
+and connects to its server on its first operation ('lazy', the default).
+With 'eager', change_stage() initializes the clients itself, so that the servers
+are running when it returns. With 'prewarm', a background thread initializes
+them, without making change_stage() wait.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Sequence
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def prewarm(initializers: Sequence[Callable[[], None]]) -> threading.Thread:
+    """
+    Run the initializers in a background thread.
+
+    The thread stops early when clear() is called, i.e. on a change of stage.
+    Errors are ignored: the clients raise them again on first use.
+    """
+    with _lock:
+        generation = _generation
+
+    def run():
+        for initialize in initializers:
+            with _lock:
+                if generation != _generation:
+                    return
+            try:
+                initialize()
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=run, name="seamless-config-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear() -> None:
+    """Abandon running prewarms (on a change of stage)."""
+    global _generation
+    with _lock:
+        _generation += 1
+
+
+__all__ = ["prewarm", "clear"]
@@ -0,0 +1,83 @@
+"""Bounded in-process caches.
+
+The 'memory_cache' command bounds the buffer cache of Seamless
+(seamless.caching.buffer_cache) in this process. Seamless keeps the buffers of
+a run in that cache, and the results of transformations in the in-process
+transformation cache of seamless-transformer, so that identical transformations
+within a run are not recomputed. The buffer cache only evicts when its eviction
+is run: with a memory_cache size, change_stage() sets the caps of the cache to
+that size and starts a background thread that runs the eviction periodically.
+Evicted buffers are demoted to weak references.
+"""
+
+from __future__ import annotations
+
+import threading
+
+# Seconds between two evictions of the buffer cache
+EVICTION_INTERVAL = 5.0
+
+_evictor: "BufferCacheEvictor | None" = None
+# Caps of the buffer cache before the first activation
+_default_caps: tuple[int, int] | None = None
+
+
+class BufferCacheEvictor(threading.Thread):
+    """Background thread that runs the eviction of the buffer cache."""
+
+    def __init__(self, cache, *, interval: float):
+        super().__init__(name="seamless-config-buffer-cache-evictor", daemon=True)
+        self.cache = cache
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.cache.run_eviction_once()
+            except Exception:
+                continue
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def activate(size: int) -> bool:
+    """
+    Bound the Seamless buffer cache of this process to size bytes.
+
+    Returns False if Seamless is not installed, or inside a Seamless worker
+    process, which has no buffer cache of its own.
+    """
+    global _evictor, _default_caps
+    try:
+        from seamless.caching.buffer_cache import get_buffer_cache
+
+        cache = get_buffer_cache()
+    except (ImportError, RuntimeError):
+        return False
+    deactivate()
+    if _default_caps is None:
+        _default_caps = cache.soft_cap, cache.hard_cap
+    cache.soft_cap = cache.hard_cap = size
+    cache.run_eviction_once()
+    _evictor = BufferCacheEvictor(cache, interval=EVICTION_INTERVAL)
+    _evictor.start()
+    return True
+
+
+def deactivate() -> None:
+    """Stop bounding the buffer cache, and restore its default caps."""
+    global _evictor
+    if _evictor is None:
+        return
+    _evictor.stop()
+    cache, _evictor = _evictor.cache, None
+    if _default_caps is not None:
+        cache.soft_cap, cache.hard_cap = _default_caps
+
+
+__all__ = [
+    "activate",
+    "deactivate",
+]
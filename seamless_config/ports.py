@@ -0,0 +1,170 @@
+"""Port sub-range leases for launched servers.
+
+When a cluster defines 'port_leases', the port_start/port_end range of a
+frontend service is divided into blocks. Each launch key leases its own block,
+so that concurrent launches on the same frontend do not compete for the same
+ports. Leases are recorded in ~/.seamless/port-leases.json, under a file lock,
+and expire after a time-to-live unless they are renewed by a new configure call.
+Leased blocks are also cached in the process, so that the lease file is only
+locked again when the lease is due for renewal (after half its time-to-live).
+When the payload of a running server is reused instead of configuring it
+again, renew_lease() keeps its lease from expiring.
+For servers that run on this host, the candidate ports are probed in parallel
+and blocks with ports in use are skipped.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Iterable
+
+from ._lockfile import LockedJsonFile
+
+LEASE_FILENAME = "port-leases.json"
+
+# (pool, key) => (leased block, time after which the lease is renewed)
+_leased: dict[tuple[str, str], tuple[tuple[int, int], float]] = {}
+
+
+def lease_file() -> str:
+    home_dir = os.environ.get("HOME") or os.path.expanduser("~")
+    return os.path.join(home_dir, ".seamless", LEASE_FILENAME)
+
+
+def _port_is_free(host: str, port: int) -> bool:
+    import socket
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # As servers do, so that ports in TIME_WAIT count as free
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def probe_ports(host: str, ports: Iterable[int]) -> dict[int, bool]:
+    """Check in parallel which ports can be bound on this host."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    ports = list(ports)
+    if not ports:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(ports), 32)) as executor:
+        free = executor.map(lambda port: _port_is_free(host, port), ports)
+        return dict(zip(ports, free))
+
+
+def lease_ports(
+    pool: str,
+    key: str,
+    port_start: int,
+    port_end: int,
+    *,
+    block_size: int,
+    ttl: float,
+    probe_host: str | None = None,
+) -> tuple[int, int] | None:
+    """
+    Lease a block of ports from the inclusive range port_start-port_end.
+
+    pool identifies the range (e.g. frontend hostname plus range); key is the
+    launch key of the server. The same key gets the same block back, and its
+    lease is renewed. If probe_host is not None, the ports are probed on that
+    interface of this host, and blocks with ports in use are avoided.
+    Returns the (start, end) of the block, or None if all blocks are leased.
+    """
+    now = time.time()
+    cached = _leased.get((pool, key))
+    if cached is not None and now < cached[1]:
+        return cached[0]
+    lease_file_ = LockedJsonFile(lease_file())
+    with lease_file_ as data:
+        leases = data.setdefault(pool, {})
+        for leased_key, lease in list(leases.items()):
+            if lease["expires"] < now:
+                del leases[leased_key]
+        lease = leases.get(key)
+        if lease is not None:
+            # Renew, but avoid rewriting the file on every call
+            if lease["expires"] - now < ttl / 2:
+                lease["expires"] = now + ttl
+                lease["ttl"] = ttl
+                lease_file_.save(data)
+            block = lease["start"], lease["end"]
+            _leased[pool, key] = block, lease["expires"] - ttl / 2
+            return block
+
+        leased = [(lease["start"], lease["end"]) for lease in leases.values()]
+        candidates = []
+        for start in range(port_start, port_end + 1, block_size):
+            end = min(start + block_size - 1, port_end)
+            if any(start <= e and s <= end for s, e in leased):
+                continue
+            candidates.append((start, end))
+        if not candidates:
+            return None
+        block = candidates[0]
+        if probe_host is not None:
+            ports = [port for start, end in candidates for port in range(start, end + 1)]
+            free = probe_ports(probe_host, ports)
+            for start, end in candidates:
+                if all(free[port] for port in range(start, end + 1)):
+                    block = start, end
+                    break
+
+        leases[key] = {
+            "start": block[0],
+            "end": block[1],
+            "expires": now + ttl,
+            "ttl": ttl,
+        }
+        lease_file_.save(data)
+        _leased[pool, key] = block, now + ttl / 2
+        return block
+
+
+def renew_lease(config: dict[str, Any]) -> None:
+    """
+    Renew the lease of the port block of a launch dict, when the payload of
+    its running server is reused. Does nothing if the block is not leased.
+    """
+    key = config.get("key")
+    block = config.get("port_start"), config.get("port_end")
+    if key is None or None in block:
+        return
+    now = time.time()
+    for (_, leased_key), (leased_block, renew_after) in _leased.items():
+        if leased_key == key and leased_block == block and now < renew_after:
+            return
+    path = lease_file()
+    if not os.path.exists(path):
+        return
+    lease_file_ = LockedJsonFile(path)
+    with lease_file_ as data:
+        for pool, leases in data.items():
+            lease = leases.get(key)
+            if lease is None or (lease["start"], lease["end"]) != block:
+                continue
+            ttl = lease.get("ttl")
+            if ttl is None:
+                return
+            if lease["expires"] - now < ttl / 2:
+                lease["expires"] = now + ttl
+                lease_file_.save(data)
+            _leased[pool, key] = block, lease["expires"] - ttl / 2
+            return
+
+
+def release_ports(pool: str, key: str) -> None:
+    """Release the lease of a launch key, e.g. after its server was stopped."""
+    _leased.pop((pool, key), None)
+    lease_file_ = LockedJsonFile(lease_file())
+    with lease_file_ as data:
+        if data.get(pool, {}).pop(key, None) is not None:
+            lease_file_.save(data)
+
+
+__all__ = ["lease_file", "probe_ports", "lease_ports", "renew_lease", "release_ports"]
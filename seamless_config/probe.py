@@ -0,0 +1,156 @@
+"""Latency probing and ordering of buffer/database clients.
+
+Used by set_remote_clients when probing is enabled: all candidate clients are
+probed in parallel, then ordered by health, locality (directory before HTTP)
+and measured latency. An optional background thread re-probes periodically and
+records which clients are unhealthy (see get_unhealthy_clients). It never
+re-activates the clients itself, since they are in use by other threads.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Sequence
+
+
+def probe_client(kind: str, location: str, timeout: float) -> float | None:
+    """Return the latency (in seconds) of a client, or None if it is unhealthy.
+
+    kind is "directory" or "url". URLs are probed at their healthcheck endpoint;
+    a server that answers with a client error (e.g. 404 because it has no such
+    endpoint) is still alive.
+    """
+    start = time.perf_counter()
+    if kind == "directory":
+        if not os.path.isdir(location):
+            return None
+        try:
+            os.listdir(location)
+        except OSError:
+            return None
+        return time.perf_counter() - start
+
+    import urllib.error
+    import urllib.request
+
+    url = location.rstrip("/") + "/healthcheck"
+    try:
+        with urllib.request.urlopen(url, timeout=timeout):
+            pass
+    except urllib.error.HTTPError as exc:
+        if exc.code >= 500:
+            return None
+    except Exception:
+        return None
+    return time.perf_counter() - start
+
+
+def order_clients(
+    candidates: Sequence[tuple[str, str, str]], timeout: float
+) -> tuple[list[str], dict[str, float | None]]:
+    """Probe (name, kind, location) candidates in parallel and order them.
+
+    Healthy clients come first, directories before URLs, then by latency.
+    Unhealthy clients are kept, but demoted to the end in their original order.
+    Returns the ordered names and the measured latencies.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not candidates:
+        return [], {}
+    with ThreadPoolExecutor(max_workers=min(len(candidates), 16)) as executor:
+        futures = [
+            executor.submit(probe_client, kind, location, timeout)
+            for _, kind, location in candidates
+        ]
+        latencies = {
+            name: future.result() for (name, _, _), future in zip(candidates, futures)
+        }
+
+    def sort_key(item: tuple[int, tuple[str, str, str]]):
+        position, (name, kind, _) = item
+        latency = latencies[name]
+        if latency is None:
+            return (1, 0, 0.0, position)
+        return (0, 0 if kind == "directory" else 1, latency, position)
+
+    ordered = sorted(enumerate(candidates), key=sort_key)
+    return [name for _, (name, _, _) in ordered], latencies
+
+
+# Names of the clients that failed their last probe
+_unhealthy_clients: set[str] = set()
+_health_lock = threading.Lock()
+_probers: list["ClientProber"] = []
+
+
+def get_unhealthy_clients() -> set[str]:
+    """Return the names of the clients that failed their most recent probe."""
+    with _health_lock:
+        return set(_unhealthy_clients)
+
+
+def _record_health(
+    latencies: dict[str, float | None], prober: "ClientProber | None" = None
+) -> None:
+    with _health_lock:
+        if prober is not None and prober.stopped:
+            return
+        for name, latency in latencies.items():
+            if latency is None:
+                _unhealthy_clients.add(name)
+            else:
+                _unhealthy_clients.discard(name)
+
+
+class ClientProber(threading.Thread):
+    """Background thread that re-probes clients and records their health."""
+
+    def __init__(
+        self,
+        candidates: Sequence[tuple[str, str, str]],
+        *,
+        timeout: float,
+        interval: float,
+    ):
+        super().__init__(name="seamless-config-client-prober", daemon=True)
+        self.candidates = list(candidates)
+        self.timeout = timeout
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                _, latencies = order_clients(self.candidates, self.timeout)
+            except Exception:
+                continue
+            _record_health(latencies, self)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_prober(
+    candidates: Sequence[tuple[str, str, str]], *, timeout: float, interval: float
+) -> ClientProber:
+    """Start a background prober; it runs until stop_probers() is called."""
+    prober = ClientProber(candidates, timeout=timeout, interval=interval)
+    _probers.append(prober)
+    prober.start()
+    return prober
+
+
+def stop_probers() -> None:
+    """Stop all background probers and forget the recorded health."""
+    while _probers:
+        _probers.pop().stop()
+    with _health_lock:
+        _unhealthy_clients.clear()
+
@@ -11,6 +11,8 @@ DISABLED = False  # to disable automatic activation during tests
 
 _launcher_cache: dict[Any, dict] = {}
 _launched_handle: "PureDaskserverLaunchedHandle | None" = None
+# Handles for other queues than the main one, launched on demand (queue routing)
+_queue_handles: dict[str, "PureDaskserverLaunchedHandle"] = {}
 
 
 def _freeze_value(value: Any) -> Any:
@@ -29,8 +31,17 @@ class PureDaskserverLaunchedHandle:
     client: Any
     dashboard_url: str | None
 
-    def __init__(self, cluster: str, queue: str | None, frontend_name: str | None):
+    def __init__(
+        self,
+        cluster: str,
+        queue: str | None,
+        frontend_name: str | None,
+        *,
+        set_as_default: bool = True,
+    ):
         self.dashboard_url = None
+        self.queue = _resolve_queue(cluster, queue)
+        self.set_as_default = set_as_default
         self.config(cluster, queue, frontend_name)
         self._do_init()
 
@@ -44,15 +55,19 @@ class PureDaskserverLaunchedHandle:
         )
 
     def _do_init(self) -> None:
-        import remote_http_launcher
+        from .daemon import launch
+        from .ports import renew_lease
 
         conf = self.launch_config
         frozenconf = _freeze_value(conf)
         payload = _launcher_cache.get(frozenconf)
         if payload is None:
             print("Launch daskserver...", file=sys.stderr)
-            payload = remote_http_launcher.run(conf)
+            payload = launch(conf)
             _launcher_cache[frozenconf] = payload
+        else:
+            # The running server keeps its ports
+            renew_lease(conf)
 
         self.launch_payload = payload
         hostname = payload.get("hostname", "localhost")
@@ -70,10 +85,26 @@ class PureDaskserverLaunchedHandle:
         from distributed import Client as DistributedClient
 
         self.client = DistributedClient(
-            scheduler_address, timeout="10s", set_as_default=True
+            scheduler_address, timeout="10s", set_as_default=self.set_as_default
         )
 
 
+def _resolve_queue(cluster: str, queue: str | None) -> str | None:
+    from .cluster import get_cluster
+    from .select import get_queue
+
+    return queue or get_queue(cluster) or get_cluster(cluster).default_queue
+
+
+def _close_handle(handle: PureDaskserverLaunchedHandle) -> None:
+    try:
+        client = getattr(handle, "client", None)
+        if client is not None:
+            client.close(timeout="2s")
+    except Exception:
+        pass
+
+
 def activate(*, no_main: bool = False, queue: str | None = None) -> None:
     """Launch the remote daskserver and configure a distributed.Client."""
 
@@ -95,23 +126,74 @@ def deactivate() -> None:
     """Clear the current Dask client and launched handle."""
 
     global _launched_handle
+    for handle in _queue_handles.values():
+        _close_handle(handle)
+    _queue_handles.clear()
     if _launched_handle is None:
         return
-    try:
-        client = getattr(_launched_handle, "client", None)
-        if client is not None:
-            client.close(timeout="2s")
-    except Exception:
-        pass
+    _close_handle(_launched_handle)
     _launched_handle = None
 
 
-def get_client():
-    """Return the current distributed.Client if pure Dask mode is active."""
+def get_client(queue: str | None = None):
+    """
+    Return the current distributed.Client if pure Dask mode is active.
+
+    If queue is given and differs from the queue of the main client,
+    a daskserver for that queue is launched on first use, and its client
+    is returned. The main client remains the default client.
+    """
 
     if _launched_handle is None:
         return None
-    return _launched_handle.client
+    if queue is None or queue == _launched_handle.queue:
+        return _launched_handle.client
+    handle = _queue_handles.get(queue)
+    if handle is None:
+        from .select import get_selected_cluster
+
+        cluster = get_selected_cluster()
+        if cluster is None:
+            raise ConfigurationError("No cluster defined")
+        handle = PureDaskserverLaunchedHandle(
+            cluster, queue, None, set_as_default=False
+        )
+        _queue_handles[queue] = handle
+    return handle.client
 
 
-__all__ = ["activate", "deactivate", "get_client", "PureDaskserverLaunchedHandle"]
+def get_client_for_resources(resources: dict[str, Any] | None):
+    """
+    Return the client for a transformation with the given resource hints.
+
+    With 'queue_routing: true', the hints select the cheapest queue that fits
+    (see routing.route_queue). Otherwise, the main client is returned.
+    If the selected queue is one of the worker_pools of the main daskserver,
+    the main client is returned too; tasks must then be submitted with
+    resources=routing.pool_resources(resources) to run on that pool.
+
+    Nothing in seamless_config submits tasks: this is the entry point for code
+    that submits to Dask in pure Dask mode. Without it, all tasks go to the
+    main client, whatever their resource hints.
+    """
+    from .select import get_queue_routing, get_worker_pools
+
+    if _launched_handle is None:
+        return None
+    if not resources or not get_queue_routing():
+        return _launched_handle.client
+    from .routing import route_queue
+
+    queue = route_queue(resources)
+    if queue in (get_worker_pools() or []):
+        return _launched_handle.client
+    return get_client(queue)
+
+
+__all__ = [
+    "activate",
+    "deactivate",
+    "get_client",
+    "get_client_for_resources",
+    "PureDaskserverLaunchedHandle",
+]
@@ -0,0 +1,117 @@
+"""Jittered exponential backoff for connecting to remote services.
+
+When many workers start at once, they all connect to the same hashserver,
+database and Dask scheduler. The retry policy spreads and retries these
+connections, and records the outcome as metrics instead of failing silently.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable
+
+# Used when the cluster defines no connect_policy: a single attempt
+DEFAULT_POLICY = {
+    "max_attempts": 1,
+    "base_delay": 0.5,
+    "max_delay": 30.0,
+    "budget": None,
+    "initial_jitter": 0.0,
+}
+
+
+def _connection_errors() -> tuple[type[BaseException], ...]:
+    errors: tuple[type[BaseException], ...] = (OSError,)
+    try:
+        import aiohttp
+    except ImportError:
+        return errors
+    return errors + (aiohttp.ClientConnectionError,)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    Return True if exc is, or was caused by, a connection error.
+
+    Remote clients wrap connection errors (e.g. a failed healthcheck raises
+    a RuntimeError from the aiohttp error), so the chain of causes is followed.
+    """
+    errors = _connection_errors()
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, errors):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+_metrics: dict[str, dict[str, Any]] = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(name: str, event: str, error: BaseException | None = None) -> None:
+    with _metrics_lock:
+        metric = _metrics.setdefault(
+            name,
+            {"attempts": 0, "successes": 0, "failures": 0, "gave_up": 0, "last_error": None},
+        )
+        metric[event] += 1
+        if error is not None:
+            metric["last_error"] = f"{type(error).__name__}: {error}"
+
+
+def get_connect_metrics() -> dict[str, dict[str, Any]]:
+    """Return connection metrics per service: attempts, successes, failures, gave_up, last_error."""
+    with _metrics_lock:
+        return {name: dict(metric) for name, metric in _metrics.items()}
+
+
+def reset_connect_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def call_with_retry(
+    func: Callable[[], Any], policy: dict[str, Any] | None, name: str
+) -> Any:
+    """
+    Call func, retrying on connection errors with full-jitter exponential backoff.
+
+    policy is a dict as produced from a ClusterConnectPolicy (None for the default
+    single attempt). After the last attempt, or when the time budget is exhausted,
+    the last exception is re-raised. Other errors, such as configuration errors,
+    are re-raised immediately.
+    """
+    policy = {**DEFAULT_POLICY, **(policy or {})}
+    max_attempts = max(int(policy["max_attempts"]), 1)
+    budget = policy["budget"]
+    start = time.monotonic()
+    if policy["initial_jitter"]:
+        time.sleep(random.uniform(0, policy["initial_jitter"]))
+    attempt = 0
+    while True:
+        attempt += 1
+        _record(name, "attempts")
+        try:
+            result = func()
+        except Exception as exc:
+            _record(name, "failures", exc)
+            delay = random.uniform(
+                0, min(policy["max_delay"], policy["base_delay"] * 2 ** (attempt - 1))
+            )
+            out_of_budget = (
+                budget is not None and time.monotonic() - start + delay > budget
+            )
+            if (
+                attempt >= max_attempts
+                or out_of_budget
+                or not is_connection_error(exc)
+            ):
+                _record(name, "gave_up")
+                raise
+            time.sleep(delay)
+        else:
+            _record(name, "successes")
+            return result
@@ -0,0 +1,185 @@
+"""Resource-aware routing of transformations to cluster queues.
+
+With 'queue_routing: true', transformations that carry resource hints are
+matched against every queue of the cluster, and sent to the cheapest queue
+that fits, instead of all going to the single selected queue. In pure Dask
+mode, a daskserver is launched lazily for each queue in use (see
+pure_daskserver.get_client_for_resources). Queues that are worker pools of the
+main daskserver are reached by submitting with pool_resources(hints).
+
+Resource hints are a dict with any of the keys:
+- cores: number of cores
+- memory: size, e.g. 128GB
+- walltime: duration, e.g. 2h, or hh:mm:ss
+- gpus: number of GPUs (matched against the GPU entry of dask_resources)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+RESOURCE_HINTS = ("cores", "memory", "walltime", "gpus")
+
+# Amount of the worker pool resource that each worker provides. Tasks request 1,
+# so the tag selects the workers without limiting how many tasks run on them.
+WORKER_POOL_CAPACITY = 1_000_000
+
+
+def worker_pool_resource(queue_name: str) -> str:
+    """Name of the Dask resource that tags the workers of a worker pool."""
+    return f"pool-{queue_name}"
+
+
+def parse_walltime(value: Any, name: str = "walltime") -> float:
+    """Parse a walltime in [days-]hh:mm:ss format, or a duration, into seconds."""
+    from .units import parse_duration
+
+    if isinstance(value, str) and ":" in value:
+        days = 0
+        if "-" in value:
+            days_str, value = value.split("-", 1)
+            days = int(days_str)
+        try:
+            parts = [float(part) for part in value.split(":")]
+        except ValueError:
+            raise ValueError(f"{name}: cannot parse walltime '{value}'") from None
+        if len(parts) > 3:
+            raise ValueError(f"{name}: cannot parse walltime '{value}'")
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + part
+        return days * 86400 + seconds
+    return parse_duration(value, name)
+
+
+def parse_resource_hints(resources: dict[str, Any]) -> dict[str, float]:
+    """Validate resource hints and convert them to numbers (bytes, seconds)."""
+    from .units import parse_size
+
+    if not isinstance(resources, dict):
+        raise ValueError("Resource hints must be a mapping")
+    parsed = {}
+    for key, value in resources.items():
+        if key not in RESOURCE_HINTS:
+            valid = ", ".join(RESOURCE_HINTS)
+            raise ValueError(f"Unknown resource hint '{key}', must be one of: {valid}")
+        if value is None:
+            continue
+        if key == "memory":
+            parsed[key] = float(parse_size(value, "memory"))
+        elif key == "walltime":
+            parsed[key] = parse_walltime(value)
+        else:
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"Resource hint '{key}' must be a non-negative number")
+            parsed[key] = float(value)
+    return parsed
+
+
+def queue_capacity(queue, cluster) -> dict[str, float]:
+    """What a single job of the queue provides. Unknown capacities are infinite."""
+    from .units import parse_size
+
+    cores = queue.cores
+    if cores is None and not queue.exclusive and cluster.type == "local":
+        cores = cluster.workers
+    capacity = {
+        "cores": float(cores) if cores is not None else math.inf,
+        "memory": (
+            float(parse_size(queue.memory, f"queue {queue.name}: memory"))
+            if queue.memory is not None
+            else math.inf
+        ),
+        "walltime": (
+            parse_walltime(queue.walltime, f"queue {queue.name}: walltime")
+            if queue.walltime is not None
+            else math.inf
+        ),
+        "gpus": float((queue.dask_resources or {}).get("GPU", 0)),
+    }
+    return capacity
+
+
+def route_queue(resources: dict[str, Any] | None, cluster: str | None = None) -> str:
+    """
+    Return the name of the cheapest queue of the cluster that fits the resource hints.
+
+    Queues with an explicit 'cost' are ranked by it, and come first. Other queues
+    are ranked by what a job reserves: GPUs, then memory, cores and walltime.
+    Ties go to the queue defined first. queue_overrides are taken into account
+    for the selected queue only, as they are when its daskserver is launched.
+    """
+    from . import ConfigurationError
+    from .cluster import get_cluster
+    from .select import get_queue, get_queue_overrides, get_selected_cluster
+
+    if cluster is None:
+        cluster = get_selected_cluster()
+    if cluster is None:
+        raise ConfigurationError("No cluster defined")
+    clus = get_cluster(cluster)
+    if not clus.queues:
+        raise ConfigurationError(f"Cluster '{cluster}' has no queues")
+    hints = parse_resource_hints(resources or {})
+    overrides = get_queue_overrides()
+    selected_queue = get_queue(cluster) or clus.default_queue
+
+    candidates = []
+    for position, (queue_name, queue) in enumerate(clus.queues.items()):
+        if queue_name == selected_queue:
+            queue = queue.with_overrides(overrides, clus.type)
+        capacity = queue_capacity(queue, clus)
+        if any(hints[key] > capacity[key] for key in hints):
+            continue
+        cost = queue.cost if queue.cost is not None else math.inf
+        rank = (
+            cost,
+            capacity["gpus"],
+            capacity["memory"],
+            capacity["cores"],
+            capacity["walltime"],
+            position,
+        )
+        candidates.append((rank, queue_name))
+    if not candidates:
+        raise ConfigurationError(
+            f"No queue of cluster '{cluster}' fits the resources {resources}"
+        )
+    return min(candidates)[1]
+
+
+def pool_resources(
+    resources: dict[str, Any] | None, cluster: str | None = None
+) -> dict[str, int]:
+    """
+    Return the Dask resources that pin a task with the given resource hints
+    to a worker pool, e.g. {"pool-gpu": 1}, to be passed to client.submit.
+
+    This only applies with 'queue_routing: true' and 'worker_pools', when the
+    hints are routed to the selected queue or one of its worker pools.
+    Otherwise, an empty dict is returned.
+    """
+    from .cluster import get_cluster
+    from .select import get_queue, get_queue_routing, get_selected_cluster, get_worker_pools
+
+    pools = get_worker_pools()
+    if not resources or not pools or not get_queue_routing():
+        return {}
+    if cluster is None:
+        cluster = get_selected_cluster()
+    queue = route_queue(resources, cluster)
+    selected_queue = get_queue(cluster) or get_cluster(cluster).default_queue
+    if queue != selected_queue and queue not in pools:
+        return {}
+    return {worker_pool_resource(queue): 1}
+
+
+__all__ = [
+    "RESOURCE_HINTS",
+    "WORKER_POOL_CAPACITY",
+    "parse_resource_hints",
+    "pool_resources",
+    "route_queue",
+    "worker_pool_resource",
+]
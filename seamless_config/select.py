@@ -14,6 +14,11 @@ _current_persistent: Optional[bool] = None
 _current_record: bool = False
 _current_node: Optional[str] = None
 _current_nparallel: Optional[int] = None
+_current_memory_cache: Optional[int] = None
+_current_activation: str = "lazy"
+_current_queue_overrides: Optional[dict] = None
+_current_queue_routing: bool = False
+_current_worker_pools: Optional[list[str]] = None
 _execution_source: Optional[str] = None  # "command" or "manual"
 _queue_source: Optional[str] = None  # "command" or "manual"
 _queue_cluster: Optional[str] = None
@@ -21,12 +26,18 @@ _remote_source: Optional[str] = None  # "command" or "manual"
 _persistent_source: Optional[str] = None  # "command" or "manual"
 _record_source: Optional[str] = None  # "command" or "manual"
 _node_source: Optional[str] = None  # "command" or "manual"
+_memory_cache_source: Optional[str] = None  # "command" or "manual"
+_activation_source: Optional[str] = None  # "command" or "manual"
+_queue_overrides_source: Optional[str] = None  # "command" or "manual"
+_queue_routing_source: Optional[str] = None  # "command" or "manual"
+_worker_pools_source: Optional[str] = None  # "command" or "manual"
 _execution_command_seen: bool = False
 _persistent_command_seen: bool = False
 _record_command_seen: bool = False
 
 EXECUTION_MODES = ("process", "spawn", "remote")
 REMOTE_TARGETS = (None, "daskserver", "jobserver")
+ACTIVATION_MODES = ("lazy", "eager", "prewarm")
 
 from . import ConfigurationError
 
@@ -157,6 +168,85 @@ def select_node(node: Optional[str], *, source: str = "manual") -> None:
     _node_source = source
 
 
+def select_memory_cache(size, *, source: str = "manual") -> None:
+    global _current_memory_cache, _memory_cache_source
+    if size is not None:
+        from .units import parse_size
+
+        size = parse_size(size, "memory_cache")
+    _current_memory_cache = size
+    _memory_cache_source = source
+
+
+def select_activation(activation: str, *, source: str = "manual") -> None:
+    global _current_activation, _activation_source
+    if not isinstance(activation, str):
+        raise ValueError("activation must be a string")
+    if activation not in ACTIVATION_MODES:
+        valid = ", ".join(ACTIVATION_MODES)
+        raise ValueError(f"activation must be one of: {valid}")
+    _current_activation = activation
+    _activation_source = source
+
+
+def select_queue_overrides(
+    overrides: Optional[dict], *, source: str = "manual"
+) -> None:
+    """
+    Override queue fields (e.g. worker_threads, maximum_jobs) of the cluster definition.
+
+    The overrides are merged with those selected earlier; null removes them all.
+    """
+    global _current_queue_overrides, _queue_overrides_source
+    if overrides is None:
+        _current_queue_overrides = None
+        _queue_overrides_source = source
+        return
+    if not isinstance(overrides, dict):
+        raise ValueError("queue_overrides must be a mapping of queue fields")
+    from .cluster import QUEUE_OVERRIDE_FIELDS
+
+    normalized = {}
+    for key, value in overrides.items():
+        if not isinstance(key, str):
+            raise ValueError("queue_overrides: field names must be strings")
+        field = key.replace("-", "_")
+        if field not in QUEUE_OVERRIDE_FIELDS:
+            raise ValueError(f"queue_overrides: unknown queue field '{key}'")
+        normalized[field] = value
+    _current_queue_overrides = {**(_current_queue_overrides or {}), **normalized}
+    _queue_overrides_source = source
+
+
+def select_queue_routing(routing: bool, *, source: str = "manual") -> None:
+    """Route transformations to queues by their resource hints (see routing.py)."""
+    global _current_queue_routing, _queue_routing_source
+    if not isinstance(routing, bool):
+        raise ValueError("queue_routing must be a boolean")
+    _current_queue_routing = routing
+    _queue_routing_source = source
+
+
+def select_worker_pools(
+    queues: Optional[list[str]], *, source: str = "manual"
+) -> None:
+    """
+    Run workers from additional queues behind the daskserver of the selected queue.
+
+    Each queue becomes a worker pool, tagged with a Dask resource
+    (see routing.worker_pool_resource). null removes the additional pools.
+    """
+    global _current_worker_pools, _worker_pools_source
+    if queues is not None:
+        if not isinstance(queues, list) or not all(
+            isinstance(queue, str) for queue in queues
+        ):
+            raise ValueError("worker_pools must be a list of queue names")
+        queues = list(dict.fromkeys(queues))
+    _current_worker_pools = queues or None
+    _worker_pools_source = source
+
+
 def select_nparallel(nparallel: int) -> None:
     global _current_nparallel
     if isinstance(nparallel, bool) or not isinstance(nparallel, int) or nparallel < 1:
@@ -168,6 +258,10 @@ def get_stage():
     return _current_stage
 
 
+def get_substage():
+    return _current_substage
+
+
 def get_selected_project() -> Optional[str]:
     return _current_project
 
@@ -231,6 +325,26 @@ def get_node() -> Optional[str]:
     return _current_node
 
 
+def get_memory_cache_size() -> Optional[int]:
+    return _current_memory_cache
+
+
+def get_activation() -> str:
+    return _current_activation
+
+
+def get_queue_overrides() -> Optional[dict]:
+    return _current_queue_overrides
+
+
+def get_queue_routing() -> bool:
+    return _current_queue_routing
+
+
+def get_worker_pools() -> Optional[list[str]]:
+    return _current_worker_pools
+
+
 def get_nparallel() -> int:
     if _current_nparallel is None:
         raise ConfigurationError(
@@ -318,6 +432,91 @@ def reset_node_before_load() -> None:
         _current_node = None
 
 
+def reset_memory_cache_before_load() -> None:
+    global _current_memory_cache, _memory_cache_source
+    if _memory_cache_source == "command":
+        _memory_cache_source = None
+        _current_memory_cache = None
+
+
+def reset_activation_before_load() -> None:
+    global _current_activation, _activation_source
+    if _activation_source == "command":
+        _activation_source = None
+        _current_activation = "lazy"
+
+
+def reset_queue_routing_before_load() -> None:
+    global _current_queue_routing, _queue_routing_source
+    if _queue_routing_source == "command":
+        _queue_routing_source = None
+        _current_queue_routing = False
+
+
+def reset_worker_pools_before_load() -> None:
+    global _current_worker_pools, _worker_pools_source
+    if _worker_pools_source == "command":
+        _worker_pools_source = None
+        _current_worker_pools = None
+
+
+def reset_queue_overrides_before_load() -> None:
+    global _current_queue_overrides, _queue_overrides_source
+    if _queue_overrides_source == "command":
+        _queue_overrides_source = None
+        _current_queue_overrides = None
+
+
+_STATE_VARIABLES = (
+    "_current_cluster",
+    "_current_project",
+    "_current_subproject",
+    "_current_stage",
+    "_current_substage",
+    "_current_execution",
+    "_current_queue",
+    "_current_remote",
+    "_current_persistent",
+    "_current_record",
+    "_current_node",
+    "_current_nparallel",
+    "_current_memory_cache",
+    "_current_activation",
+    "_current_queue_overrides",
+    "_current_queue_routing",
+    "_current_worker_pools",
+    "_execution_source",
+    "_queue_source",
+    "_queue_cluster",
+    "_remote_source",
+    "_persistent_source",
+    "_record_source",
+    "_node_source",
+    "_memory_cache_source",
+    "_activation_source",
+    "_queue_overrides_source",
+    "_queue_routing_source",
+    "_worker_pools_source",
+    "_execution_command_seen",
+    "_persistent_command_seen",
+    "_record_command_seen",
+)
+
+
+def get_selection_state() -> dict:
+    """Return all selections as a JSON-serializable dict (see set_selection_state)."""
+    state = globals()
+    return {name: state[name] for name in _STATE_VARIABLES}
+
+
+def set_selection_state(state: dict) -> None:
+    """Restore all selections from a dict returned by get_selection_state."""
+    unknown = set(state) - set(_STATE_VARIABLES)
+    if unknown:
+        raise ValueError(f"Unknown selection state variables: {sorted(unknown)}")
+    globals().update(state)
+
+
 def get_selected_cluster() -> Optional[str]:
     return _current_cluster
 
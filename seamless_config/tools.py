@@ -3,10 +3,58 @@ from typing import Any
 import re
 
 _tools: dict[str, dict] = {}
+_compiled_tools: dict[str, "_CompiledTool"] = {}
+
+# Memoized configure_* results, keyed on their effective inputs
+_configure_cache: dict[tuple, dict] = {}
+_configure_cache_stats = {"hits": 0, "misses": 0}
 
 DOLLAR_RE = re.compile(r"\$[A-Za-z_][A-Za-z0-9_]*")
 
 
+class _Template:
+    """A *_template value, pre-split into literal text and $VARIABLE segments."""
+
+    __slots__ = ("segments",)
+
+    def __init__(self, template: str):
+        segments: list[tuple[str, str | None]] = []
+        pos = 0
+        for m in DOLLAR_RE.finditer(template):
+            start, end = m.span()
+            segments.append((template[pos:start], m.group()[1:]))
+            pos = end
+        segments.append((template[pos:], None))
+        self.segments = tuple(segments)
+
+    def render(self, injected: dict[str, Any]) -> str:
+        parts = []
+        for literal, variable in self.segments:
+            parts.append(literal)
+            if variable is not None:
+                parts.append(str(injected[variable]))
+        return "".join(parts)
+
+
+class _CompiledTool:
+    """A tool definition with its *_template values compiled once."""
+
+    __slots__ = ("added", "injected", "items")
+
+    def __init__(self, tool: dict):
+        self.added = tuple(tool["ADDED"])
+        self.injected = tuple(tool["INJECTED"])
+        items: list[tuple[str, Any, bool]] = []
+        for key, value in tool.items():
+            if key in ("ADDED", "INJECTED"):
+                continue
+            if key.endswith("_template"):
+                items.append((key[: -len("_template")], _Template(value), True))
+            else:
+                items.append((key, value, False))
+        self.items = tuple(items)
+
+
 def define_tools(tools: dict[str, dict]):
     for toolname, tool in tools.items():
         try:
@@ -24,33 +72,139 @@ def define_tools(tools: dict[str, dict]):
             raise ValueError(f"{toolname}: {type(exc).__name__}: {exc}")
 
         _tools[toolname] = deepcopy(tool)
+        _compiled_tools[toolname] = _CompiledTool(_tools[toolname])
+    clear_configure_cache()
+
+
+def clear_configure_cache() -> None:
+    """Invalidate the memoized configure_* results.
+
+    Called by define_tools, define_clusters and on a change of stage.
+    Selections (cluster, project, stage, queue, node...) are part of the cache key.
+    """
+    _configure_cache.clear()
+
+
+def get_configure_cache_stats() -> dict[str, int]:
+    """Return the hits, misses and current number of entries of the configure_* cache."""
+    return {**_configure_cache_stats, "entries": len(_configure_cache)}
+
+
+def _memoized(key: tuple, compute) -> dict:
+    try:
+        result = _configure_cache[key]
+    except KeyError:
+        _configure_cache_stats["misses"] += 1
+        result = compute()
+        _configure_cache[key] = result
+    else:
+        _configure_cache_stats["hits"] += 1
+    # Callers may modify the returned dict
+    return _copy_config(result)
+
+
+def _copy_config(value):
+    # Configurations are plain YAML-like data: much faster than deepcopy
+    if isinstance(value, dict):
+        return {k: _copy_config(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(v) for v in value]
+    return value
+
+
+def _apply_port_lease(config: dict, cluster: str | None) -> dict:
+    """Narrow the port range of a launch dict to a leased block (see ports.py)."""
+    port_start, port_end = config.get("port_start"), config.get("port_end")
+    if port_start is None or port_end is None or cluster is None:
+        return config
+    clus = get_cluster(cluster)
+    leases = clus.port_leases
+    if leases is None:
+        return config
+    from .ports import lease_ports
+
+    hostname = config.get("hostname", "localhost")
+    probe = leases.probe if leases.probe is not None else clus.type == "local"
+    # Ports can only be probed for servers that run on this host
+    probe_host = "" if probe and hostname == "localhost" else None
+    block = lease_ports(
+        f"{hostname}:{port_start}-{port_end}",
+        config["key"],
+        port_start,
+        port_end,
+        block_size=leases.block_size,
+        ttl=leases.ttl,
+        probe_host=probe_host,
+    )
+    if block is not None:
+        config["port_start"], config["port_end"] = block
+    return config
+
+
+def _apply_duration_hints(config: dict, cluster: str | None, project, stage) -> dict:
+    """Add the learned task durations to the daskserver parameters (see durations.py)."""
+    if cluster is None:
+        return config
+    settings = get_cluster(cluster).task_durations
+    if settings is None:
+        return config
+    from .durations import get_duration_hints
+
+    hints = get_duration_hints(project, stage, max_entries=settings.max_entries)
+    if hints:
+        config["file_parameters"]["task-durations"] = hints
+    return config
+
+
+def _selection_key(cluster, project, subproject, stage, substage) -> tuple:
+    from .select import get_current, get_node, get_queue
+
+    cluster, project, subproject, stage, substage = get_current(
+        cluster, project, subproject, stage, substage
+    )
+    return (
+        cluster,
+        project,
+        subproject,
+        stage,
+        substage,
+        get_queue(cluster),
+        get_node(),
+        get_local_cluster(),
+        _queue_overrides_key(),
+        _worker_pools_key(),
+    )
+
+
+def _worker_pools_key() -> tuple | None:
+    from .select import get_worker_pools
+
+    pools = get_worker_pools()
+    return tuple(pools) if pools is not None else None
+
+
+def _queue_overrides_key() -> str | None:
+    import json
+    from .select import get_queue_overrides
+
+    overrides = get_queue_overrides()
+    if overrides is None:
+        return None
+    return json.dumps(overrides, sort_keys=True, default=str)
 
 
 def _configure_tool(tool: str, *, added: dict[str, Any], injected: dict[str, Any]):
-    conf = _tools[tool]
-    ADDED, INJECTED = conf["ADDED"], conf["INJECTED"]
-    for k in ADDED:
+    conf = _compiled_tools[tool]
+    for k in conf.added:
         if k not in added:
             raise ValueError(f'"{k}" must be added')
-    for k in INJECTED:
+    for k in conf.injected:
         if k not in injected:
             raise ValueError(f'"{k}" must be injected')
 
     result = deepcopy(added)
-    for key0, value0 in conf.items():
-        if key0 in ("ADDED", "INJECTED"):
-            continue
-        if key0.endswith("_template"):
-            key = key0[: -len("_template")]
-            value = value0
-            for m in reversed(list(DOLLAR_RE.finditer(value0))):
-                inj = injected[m.group()[1:]]
-                start, end = m.span()
-                value = value[:start] + str(inj) + value[end:]
-        else:
-            key = key0
-            value = value0
-        result[key] = value
+    for key, value, is_template in conf.items:
+        result[key] = value.render(injected) if is_template else value
 
     # Special cases: hostname, ssh_hostname, tunnel
     # => remove only for the actual local cluster so remote-http-launcher runs locally.
@@ -133,7 +287,7 @@ def _prepare_tool(
     return clus, frontend, injected
 
 
-def configure_hashserver(
+def _configure_hashserver(
     mode: str,
     *,
     cluster=None,
@@ -166,7 +320,7 @@ def configure_hashserver(
     return result
 
 
-def configure_database(
+def _configure_database(
     mode: str,
     *,
     cluster=None,
@@ -199,7 +353,7 @@ def configure_database(
     return result
 
 
-def configure_jobserver(
+def _configure_jobserver(
     *,
     cluster=None,
     project=None,
@@ -207,9 +361,8 @@ def configure_jobserver(
     stage=None,
     substage=None,
     frontend_name=None,
+    remote_client_parameters=None,
 ):
-    from .extern_clients import collect_remote_clients
-
     dummy_mode = "rw"  # not used for this tool
     clus, frontend, injected = _prepare_tool(
         "jobserver",
@@ -235,13 +388,146 @@ def configure_jobserver(
     added["port_start"] = frontend.jobserver.port_start
     added["port_end"] = frontend.jobserver.port_end
 
-    remote_client_parameters = collect_remote_clients(clus.name)
     added["file_parameters"] = remote_client_parameters
 
     return _configure_tool("jobserver", added=added, injected=injected)
 
 
-def configure_daskserver(
+def _adaptive_params(queue) -> dict[str, Any]:
+    """Parameters for cluster.adapt(), between minimum_jobs and maximum_jobs."""
+    from .units import parse_duration
+
+    params = {}
+    params["minimum_jobs"] = queue.minimum_jobs
+    if queue.adapt_interval is not None:
+        params["adapt_interval"] = parse_duration(
+            queue.adapt_interval, f"queue {queue.name}: adapt_interval"
+        )
+    params["adapt_wait_count"] = queue.adapt_wait_count
+    params["target_utilization"] = queue.target_utilization
+    return params
+
+
+def _daskserver_job_params(clus, queue, requested_node) -> dict[str, Any]:
+    """The daskserver parameters that describe the jobs of a queue."""
+    from . import ConfigurationError
+
+    params = {}
+    params["walltime"] = queue.walltime
+    params["exclusive"] = queue.exclusive
+    params["cores"] = queue.cores
+    if queue.cores is None and clus.type == "local":
+        params["cores"] = clus.workers
+    params["memory"] = queue.memory
+    params["tmpdir"] = queue.tmpdir
+    params["partition"] = queue.partition
+    job_extra_directives = list(queue.job_extra_directives or [])
+    resource_spec = None
+    if requested_node is not None:
+        if clus.type == "slurm":
+            nodelist_flag = f"--nodelist={requested_node}"
+            if nodelist_flag not in job_extra_directives:
+                job_extra_directives.append(nodelist_flag)
+        elif clus.type == "oar":
+            job_extra_directives.extend(["-p", f"host='{requested_node}'"])
+        else:
+            raise ConfigurationError(
+                f"Node selection is not supported for cluster type '{clus.type}'"
+            )
+    if queue.exclusive:
+        if queue.cores is not None:
+            # Case 1: fixed cores — job_cores equals cores
+            params["job_cores"] = queue.cores
+        else:
+            # Case 2: whole-node — use scheduler-specific exclusive mechanism
+            if clus.type == "slurm":
+                if "--exclusive" not in job_extra_directives:
+                    job_extra_directives.append("--exclusive")
+            elif clus.type == "oar":
+                resource_spec = "/nodes=1"
+    if resource_spec is not None:
+        params["resource_spec"] = resource_spec
+    params["job_extra_directives"] = job_extra_directives or None
+    params["project"] = queue.project
+    params["job_script_prologue"] = queue.job_script_prologue
+    params["worker_threads"] = queue.worker_threads
+    params["processes"] = queue.processes
+    params["lifetime-stagger"] = queue.lifetime_stagger
+    params["lifetime"] = queue.lifetime
+    params["dask-resources"] = queue.dask_resources
+    params["maximum_jobs"] = queue.maximum_jobs
+    params.update(_adaptive_params(queue))
+    return params
+
+
+def _spillover_params(clus, queue, requested_node, job_params) -> dict[str, Any]:
+    """
+    The secondary queues that receive jobs once the primary queue is saturated,
+    each with its own job parameters (see job_params).
+    """
+    from . import ConfigurationError
+    from .units import parse_duration
+
+    if not queue.spillover:
+        return {}
+    queues = clus.queues or {}
+    spillover = []
+    for queue_name in queue.spillover:
+        if queue_name not in queues:
+            raise ConfigurationError(
+                f"Queue '{queue.name}': cluster '{clus.name}' has no spillover queue '{queue_name}'"
+            )
+        secondary = job_params(clus, queues[queue_name], requested_node)
+        secondary = {k: v for k, v in secondary.items() if v is not None}
+        spillover.append({"queue": queue_name, **secondary})
+    params = {"spillover": spillover}
+    if queue.spillover_pending_time is not None:
+        params["spillover_pending_time"] = parse_duration(
+            queue.spillover_pending_time, f"queue {queue.name}: spillover_pending_time"
+        )
+    return params
+
+
+def _worker_pools_params(clus, queue, requested_node, job_params) -> dict[str, Any]:
+    """
+    The additional worker pools (see select_worker_pools), each with the job
+    parameters of its queue. The workers of every pool, including the primary
+    queue, are tagged with a Dask resource named after their queue.
+    """
+    from . import ConfigurationError
+    from .routing import WORKER_POOL_CAPACITY, worker_pool_resource
+    from .select import get_worker_pools
+
+    pool_names = [name for name in get_worker_pools() or [] if name != queue.name]
+    if not pool_names:
+        return {}
+    queues = clus.queues or {}
+
+    def tagged(resources, queue_name):
+        return {**(resources or {}), worker_pool_resource(queue_name): WORKER_POOL_CAPACITY}
+
+    pools = []
+    for queue_name in pool_names:
+        if queue_name not in queues:
+            raise ConfigurationError(
+                f"worker_pools: cluster '{clus.name}' has no queue '{queue_name}'"
+            )
+        pool_queue = queues[queue_name]
+        if pool_queue.conda != queue.conda:
+            raise ConfigurationError(
+                f"worker_pools: queue '{queue_name}' must use the same conda environment as queue '{queue.name}'"
+            )
+        pool = job_params(clus, pool_queue, requested_node)
+        pool = {k: v for k, v in pool.items() if v is not None}
+        pool["dask-resources"] = tagged(pool.get("dask-resources"), queue_name)
+        pools.append({"queue": queue_name, **pool})
+    return {
+        "dask-resources": tagged(queue.dask_resources, queue.name),
+        "worker_pools": pools,
+    }
+
+
+def _configure_daskserver(
     *,
     cluster=None,
     project=None,
@@ -252,7 +538,7 @@ def configure_daskserver(
 ):
     dummy_mode = "rw"  # not used for this tool
     from . import ConfigurationError
-    from .select import get_node, get_queue
+    from .select import get_node, get_queue, get_queue_overrides
 
     clus, frontend, injected = _prepare_tool(
         "daskserver",
@@ -290,14 +576,12 @@ def configure_daskserver(
         )
     if queue_name not in queues:
         raise ConfigurationError(f"Cluster '{clus.name}' has no queue '{queue_name}'")
-    queue = queues[queue_name]
+    queue = queues[queue_name].with_overrides(get_queue_overrides(), clus.type)
     requested_node = get_node()
     added["conda"] = queue.conda
     added["port_start"] = frontend.daskserver.port_start
     added["port_end"] = frontend.daskserver.port_end
 
-    # TODO: make queue parameters overrulable in seamless.profile.yaml (advanced use case)
-
     params = {}
 
     """
@@ -319,46 +603,8 @@ def configure_daskserver(
     - job_script_prologue: Optional, but must be a list if defined.
     """
 
-    params["walltime"] = queue.walltime
-    params["exclusive"] = queue.exclusive
-    params["cores"] = queue.cores
-    if queue.cores is None and clus.type == "local":
-        params["cores"] = clus.workers
-    params["memory"] = queue.memory
-    params["tmpdir"] = queue.tmpdir
-    params["partition"] = queue.partition
-    job_extra_directives = list(queue.job_extra_directives or [])
-    resource_spec = None
-    if requested_node is not None:
-        if clus.type == "slurm":
-            nodelist_flag = f"--nodelist={requested_node}"
-            if nodelist_flag not in job_extra_directives:
-                job_extra_directives.append(nodelist_flag)
-        elif clus.type == "oar":
-            job_extra_directives.extend(["-p", f"host='{requested_node}'"])
-        else:
-            raise ConfigurationError(
-                f"Node selection is not supported for cluster type '{clus.type}'"
-            )
-    if queue.exclusive:
-        if queue.cores is not None:
-            # Case 1: fixed cores — job_cores equals cores
-            params["job_cores"] = queue.cores
-        else:
-            # Case 2: whole-node — use scheduler-specific exclusive mechanism
-            if clus.type == "slurm":
-                if "--exclusive" not in job_extra_directives:
-                    job_extra_directives.append("--exclusive")
-            elif clus.type == "oar":
-                resource_spec = "/nodes=1"
-    if resource_spec is not None:
-        params["resource_spec"] = resource_spec
-    params["job_extra_directives"] = job_extra_directives or None
-    params["project"] = queue.project
+    params.update(_daskserver_job_params(clus, queue, requested_node))
     params["memory_per_core_property_name"] = clus.memory_per_core_property_name
-    params["job_script_prologue"] = queue.job_script_prologue
-    params["worker_threads"] = queue.worker_threads
-    params["processes"] = queue.processes
 
     """
     #### C
@@ -381,18 +627,42 @@ def configure_daskserver(
     In case of default: Note that "walltime" is in hh:mm:ss format. All three values (walltime, lifetime-stagger and 1m) are understood by `dask.utils.parse_timedelta`. The subtraction result `td` can be converted to string using f"{int(td.total_seconds())}s"
 
     - dask-resources => distributed.worker.resources. Optional.
+
+    - spillover: Optional. Secondary queues, as a list of dicts with the queue name
+      under "queue" and the job parameters of that queue. Jobs are submitted to the
+      secondary queues, in order, once the primary queue has maximum_jobs jobs, or once
+      a job has been pending for longer than spillover_pending_time (in seconds, optional).
+
+    - worker_pools: Optional. Additional pools of workers behind the same scheduler, as a
+      list of dicts with the queue name under "queue" and the job parameters of that queue.
+      The dask-resources of each pool, and of the primary queue, contain a "pool-<queue>" tag.
+
+    - minimum_jobs, adapt_interval (in seconds), adapt_wait_count, target_utilization:
+      Optional. Passed to cluster.adapt() (as minimum_jobs, interval and wait_count),
+      with maximum_jobs as the upper bound. target_utilization is the fraction of
+      worker threads that the scheduler aims to keep busy when scaling.
+
+    - task-durations => distributed.scheduler.default-task-durations. Optional.
+      Learned durations in seconds, keyed by Dask task prefix (see durations.py).
     """
 
     params["unknown-task-duration"] = queue.unknown_task_duration
     params["target-duration"] = queue.target_duration
-    # params["internal-port-range"] = frontend.daskserver. ... # TODO
-    params["lifetime-stagger"] = queue.lifetime_stagger
-    params["lifetime"] = queue.lifetime
-    params["dask-resources"] = queue.dask_resources
+    params["internal-port-range"] = frontend.daskserver.get_internal_port_range()
     params["interactive"] = queue.interactive
-    params["maximum_jobs"] = queue.maximum_jobs
 
-    # TODO: params["transformation_throttle"] = ...
+    # Maximum number of transformations in flight on the scheduler, in total and per worker
+    params["transformation_throttle"] = queue.transformation_throttle
+    params["transformation_throttle_per_worker"] = (
+        queue.transformation_throttle_per_worker
+    )
+
+    params.update(
+        _spillover_params(clus, queue, requested_node, _daskserver_job_params)
+    )
+    params.update(
+        _worker_pools_params(clus, queue, requested_node, _daskserver_job_params)
+    )
 
     params["extra_dask_config"] = queue.extra_dask_config
 
@@ -402,14 +672,62 @@ def configure_daskserver(
     return _configure_tool("daskserver", added=added, injected=injected)
 
 
-def configure_pure_daskserver(
+def _pure_daskserver_job_params(clus, queue, requested_node) -> dict[str, Any]:
+    """The pure daskserver parameters that describe the jobs of a queue."""
+    from . import ConfigurationError
+
+    params = {}
+    params["walltime"] = queue.walltime
+    params["cores"] = queue.cores
+    params["job_cores"] = queue.job_cores
+    if queue.cores is None and clus.type == "local":
+        params["cores"] = clus.workers
+    params["memory"] = queue.memory
+    params["tmpdir"] = queue.tmpdir
+    params["partition"] = queue.partition
+    job_extra_directives = list(queue.job_extra_directives or [])
+    resource_spec = None
+    if requested_node is not None:
+        if clus.type == "slurm":
+            nodelist_flag = f"--nodelist={requested_node}"
+            if nodelist_flag not in job_extra_directives:
+                job_extra_directives.append(nodelist_flag)
+        elif clus.type == "oar":
+            job_extra_directives.extend(["-p", f"host='{requested_node}'"])
+        else:
+            raise ConfigurationError(
+                f"Node selection is not supported for cluster type '{clus.type}'"
+            )
+    if queue.exclusive and queue.cores is None and clus.type == "oar":
+        resource_spec = "/nodes=1"
+    params["job_extra_directives"] = job_extra_directives or None
+    if resource_spec is not None:
+        params["resource_spec"] = resource_spec
+    params["project"] = queue.project
+    params["job_script_prologue"] = queue.job_script_prologue
+    worker_threads = queue.worker_threads
+    if worker_threads is None:
+        worker_threads = 2
+    params["worker_threads"] = worker_threads
+    params["processes"] = queue.processes
+    params["lifetime-stagger"] = queue.lifetime_stagger
+    params["lifetime"] = queue.lifetime
+    params["dask-resources"] = queue.dask_resources
+    params["maximum_jobs"] = queue.maximum_jobs
+    if params["maximum_jobs"] is None and clus.type == "local":
+        params["maximum_jobs"] = clus.workers
+    params.update(_adaptive_params(queue))
+    return params
+
+
+def _configure_pure_daskserver(
     *,
     cluster=None,
     queue: str | None = None,
     frontend_name=None,
 ):
     from . import ConfigurationError
-    from .select import get_node, get_queue, get_selected_cluster
+    from .select import get_node, get_queue, get_queue_overrides, get_selected_cluster
 
     if cluster is None:
         cluster = get_selected_cluster()
@@ -448,7 +766,8 @@ def configure_pure_daskserver(
     if frontend.ssh_hostname is not None:
         added["ssh_hostname"] = frontend.ssh_hostname
     added["network_interface"] = frontend.daskserver.network_interface
-    queue_name = queue or get_queue(cluster) or clus.default_queue
+    selected_queue = get_queue(cluster) or clus.default_queue
+    queue_name = queue or selected_queue
     queues = clus.queues or {}
     if queue_name is None:
         raise ConfigurationError(
@@ -457,6 +776,9 @@ def configure_pure_daskserver(
     if queue_name not in queues:
         raise ConfigurationError(f"Cluster '{clus.name}' has no queue '{queue_name}'")
     queue_def = queues[queue_name]
+    # queue_overrides apply to the selected queue, not to routed queues
+    if queue_name == selected_queue:
+        queue_def = queue_def.with_overrides(get_queue_overrides(), clus.type)
     injected["QUEUE"] = queue_name
     requested_node = get_node()
     added["conda"] = queue_def.conda
@@ -465,50 +787,24 @@ def configure_pure_daskserver(
 
     params = {}
 
-    params["walltime"] = queue_def.walltime
-    params["cores"] = queue_def.cores
-    params["job_cores"] = queue_def.job_cores
-    if queue_def.cores is None and clus.type == "local":
-        params["cores"] = clus.workers
-    params["memory"] = queue_def.memory
-    params["tmpdir"] = queue_def.tmpdir
-    params["partition"] = queue_def.partition
-    job_extra_directives = list(queue_def.job_extra_directives or [])
-    resource_spec = None
-    if requested_node is not None:
-        if clus.type == "slurm":
-            nodelist_flag = f"--nodelist={requested_node}"
-            if nodelist_flag not in job_extra_directives:
-                job_extra_directives.append(nodelist_flag)
-        elif clus.type == "oar":
-            job_extra_directives.extend(["-p", f"host='{requested_node}'"])
-        else:
-            raise ConfigurationError(
-                f"Node selection is not supported for cluster type '{clus.type}'"
-            )
-    if queue_def.exclusive and queue_def.cores is None and clus.type == "oar":
-        resource_spec = "/nodes=1"
-    params["job_extra_directives"] = job_extra_directives or None
-    if resource_spec is not None:
-        params["resource_spec"] = resource_spec
-    params["project"] = queue_def.project
+    params.update(_pure_daskserver_job_params(clus, queue_def, requested_node))
     params["memory_per_core_property_name"] = clus.memory_per_core_property_name
-    params["job_script_prologue"] = queue_def.job_script_prologue
-    worker_threads = queue_def.worker_threads
-    if worker_threads is None:
-        worker_threads = 2
-    params["worker_threads"] = worker_threads
-    params["processes"] = queue_def.processes
 
     params["unknown-task-duration"] = queue_def.unknown_task_duration
     params["target-duration"] = queue_def.target_duration
-    params["lifetime-stagger"] = queue_def.lifetime_stagger
-    params["lifetime"] = queue_def.lifetime
-    params["dask-resources"] = queue_def.dask_resources
+    params["internal-port-range"] = frontend.daskserver.get_internal_port_range()
     params["interactive"] = queue_def.interactive
-    params["maximum_jobs"] = queue_def.maximum_jobs
-    if params["maximum_jobs"] is None and clus.type == "local":
-        params["maximum_jobs"] = clus.workers
+    params.update(
+        _spillover_params(clus, queue_def, requested_node, _pure_daskserver_job_params)
+    )
+    worker_pools = _worker_pools_params(
+        clus, queue_def, requested_node, _pure_daskserver_job_params
+    )
+    if worker_pools:
+        params.update(worker_pools)
+        # A different server than the one for the queue alone
+        pool_names = [pool["queue"] for pool in worker_pools["worker_pools"]]
+        injected["QUEUE"] = "+".join([queue_name, *pool_names])
     params["pure_dask"] = True
     params["extra_dask_config"] = queue_def.extra_dask_config
 
@@ -516,3 +812,145 @@ def configure_pure_daskserver(
     added["file_parameters"] = params
 
     return _configure_tool("pure_daskserver", added=added, injected=injected)
+
+
+def configure_hashserver(
+    mode: str,
+    *,
+    cluster=None,
+    project=None,
+    subproject=None,
+    stage=None,
+    frontend_name=None,
+):
+    selection_key = _selection_key(cluster, project, subproject, stage, None)
+    key = ("hashserver", mode, frontend_name, *selection_key)
+    config = _memoized(
+        key,
+        lambda: _configure_hashserver(
+            mode,
+            cluster=cluster,
+            project=project,
+            subproject=subproject,
+            stage=stage,
+            frontend_name=frontend_name,
+        ),
+    )
+    return _apply_port_lease(config, selection_key[0])
+
+
+def configure_database(
+    mode: str,
+    *,
+    cluster=None,
+    project=None,
+    subproject=None,
+    stage=None,
+    frontend_name=None,
+):
+    selection_key = _selection_key(cluster, project, subproject, stage, None)
+    key = ("database", mode, frontend_name, *selection_key)
+    config = _memoized(
+        key,
+        lambda: _configure_database(
+            mode,
+            cluster=cluster,
+            project=project,
+            subproject=subproject,
+            stage=stage,
+            frontend_name=frontend_name,
+        ),
+    )
+    return _apply_port_lease(config, selection_key[0])
+
+
+def configure_jobserver(
+    *,
+    cluster=None,
+    project=None,
+    subproject=None,
+    stage=None,
+    substage=None,
+    frontend_name=None,
+):
+    from .extern_clients import collect_remote_clients, remote_clients_key
+
+    selection_key = _selection_key(cluster, project, subproject, stage, substage)
+    # The launched clients live in seamless_remote and are not under our control:
+    # they are part of the key
+    key = ("jobserver", frontend_name, *selection_key, remote_clients_key())
+    config = _memoized(
+        key,
+        lambda: _configure_jobserver(
+            cluster=cluster,
+            project=project,
+            subproject=subproject,
+            stage=stage,
+            substage=substage,
+            frontend_name=frontend_name,
+            remote_client_parameters=collect_remote_clients(selection_key[0]),
+        ),
+    )
+    return _apply_port_lease(config, selection_key[0])
+
+
+def configure_daskserver(
+    *,
+    cluster=None,
+    project=None,
+    subproject=None,
+    stage=None,
+    substage=None,
+    frontend_name=None,
+):
+    selection_key = _selection_key(cluster, project, subproject, stage, substage)
+    key = ("daskserver", frontend_name, *selection_key)
+    config = _memoized(
+        key,
+        lambda: _configure_daskserver(
+            cluster=cluster,
+            project=project,
+            subproject=subproject,
+            stage=stage,
+            substage=substage,
+            frontend_name=frontend_name,
+        ),
+    )
+    config = _apply_duration_hints(
+        config, selection_key[0], selection_key[1], selection_key[3]
+    )
+    return _apply_port_lease(config, selection_key[0])
+
+
+def configure_pure_daskserver(
+    *,
+    cluster=None,
+    queue: str | None = None,
+    frontend_name=None,
+):
+    from .select import get_node, get_queue, get_selected_cluster
+
+    if cluster is None:
+        cluster = get_selected_cluster()
+    selected_queue = get_queue(cluster)
+    if selected_queue is None and cluster is not None:
+        selected_queue = get_cluster(cluster).default_queue
+    # queue_overrides only apply if queue is the selected queue
+    key = (
+        "pure_daskserver",
+        frontend_name,
+        cluster,
+        queue,
+        selected_queue,
+        get_node(),
+        get_local_cluster(),
+        _queue_overrides_key(),
+        _worker_pools_key(),
+    )
+    config = _memoized(
+        key,
+        lambda: _configure_pure_daskserver(
+            cluster=cluster, queue=queue, frontend_name=frontend_name
+        ),
+    )
+    return _apply_port_lease(config, cluster)
@@ -0,0 +1,76 @@
+"""Parsing of human-readable sizes and durations in configuration values."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+_NUMBER_UNIT_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]*)\s*$")
+
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 10**3,
+    "kb": 10**3,
+    "m": 10**6,
+    "mb": 10**6,
+    "g": 10**9,
+    "gb": 10**9,
+    "t": 10**12,
+    "tb": 10**12,
+    "kib": 2**10,
+    "mib": 2**20,
+    "gib": 2**30,
+    "tib": 2**40,
+}
+
+
+def parse_size(value: Any, name: str = "size") -> int:
+    """Parse a size such as 4GB, 512MiB or 1000 (bytes) into a number of bytes."""
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a size, e.g. 4GB")
+    if isinstance(value, int):
+        if value < 0:
+            raise ValueError(f"{name} must not be negative")
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a size, e.g. 4GB")
+    match = _NUMBER_UNIT_RE.match(value)
+    if match is None:
+        raise ValueError(f"{name}: cannot parse size '{value}'")
+    number, unit = match.groups()
+    multiplier = _SIZE_UNITS.get(unit.lower())
+    if multiplier is None:
+        raise ValueError(f"{name}: unknown size unit '{unit}'")
+    return int(float(number) * multiplier)
+
+
+_DURATION_UNITS = {
+    "": 1.0,
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "m": 60.0,
+    "min": 60.0,
+    "h": 3600.0,
+}
+
+
+def parse_duration(value: Any, name: str = "duration") -> float:
+    """Parse a duration such as 500ms, 2s, 1m or 0.5 (seconds) into seconds."""
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a duration, e.g. 2s")
+    if isinstance(value, (int, float)):
+        if value < 0:
+            raise ValueError(f"{name} must not be negative")
+        return float(value)
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a duration, e.g. 2s")
+    match = _NUMBER_UNIT_RE.match(value)
+    if match is None:
+        raise ValueError(f"{name}: cannot parse duration '{value}'")
+    number, unit = match.groups()
+    multiplier = _DURATION_UNITS.get(unit.lower())
+    if multiplier is None:
+        raise ValueError(f"{name}: unknown duration unit '{unit}'")
+    return float(number) * multiplier
@@ -0,0 +1,45 @@
+"""Microbenchmark of the configure_* functions (run: python tests/bench-configure.py)"""
+
+import time
+
+from seamless_config.cluster import define_clusters
+from seamless_config.config_files import load_tools
+import seamless_config.tools as tools
+
+N = 10000
+
+load_tools()
+define_clusters(
+    {
+        "bench": {
+            "type": "local",
+            "tunnel": False,
+            "frontends": [
+                {
+                    "hostname": "localhost",
+                    "hashserver": {"bufferdir": "/tmp/bench-buffers"},
+                    "database": {"database_dir": "/tmp/bench-db"},
+                    "daskserver": {
+                        "network_interface": "lo",
+                        "port_start": 60000,
+                        "port_end": 60100,
+                    },
+                }
+            ],
+            "queues": {"default": {"conda": "seamless", "walltime": "01:00:00"}},
+            "default_queue": "default",
+        }
+    }
+)
+
+for name, func in (
+    ("configure_hashserver", lambda: tools.configure_hashserver("rw", cluster="bench", project="p")),
+    ("configure_database", lambda: tools.configure_database("rw", cluster="bench", project="p")),
+    ("configure_daskserver", lambda: tools.configure_daskserver(cluster="bench", project="p")),
+):
+    func()
+    start = time.perf_counter()
+    for _ in range(N):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed / N * 1e6:.1f} us per call")
@@ -0,0 +1,45 @@
+import pytest
+
+from seamless_config.cluster import Cluster
+
+
+def _cluster_dict(**extra):
+    dic = {
+        "type": "slurm",
+        "frontends": [
+            {"hostname": "frontend", "hashserver": {"bufferdir": "/buffers"}}
+        ],
+    }
+    dic.update(extra)
+    return dic
+
+
+def test_client_probing_is_parsed():
+    clus = Cluster.from_dict(
+        "demo", _cluster_dict(client_probing={"timeout": "500ms", "reprobe_interval": None})
+    )
+    assert clus.client_probing.timeout == pytest.approx(0.5)
+    assert clus.client_probing.reprobe_interval is None
+
+    clus = Cluster.from_dict("demo", _cluster_dict(client_probing={"reprobe_interval": "1m"}))
+    assert clus.client_probing.reprobe_interval == 60
+    clus = Cluster.from_dict("demo", _cluster_dict(client_probing=True))
+    assert clus.client_probing.reprobe_interval is None
+
+
+def test_connect_policy_is_parsed():
+    clus = Cluster.from_dict(
+        "demo", _cluster_dict(connect_policy={"max_attempts": 8, "initial_jitter": "5s"})
+    )
+    assert clus.connect_policy.max_attempts == 8
+    assert clus.connect_policy.initial_jitter == 5
+    assert clus.connect_policy.budget == 120
+
+
+def test_port_leases_are_parsed():
+    clus = Cluster.from_dict("demo", _cluster_dict(port_leases={"block_size": 5}))
+    assert clus.port_leases.block_size == 5
+    assert clus.port_leases.ttl == 3600
+    assert clus.port_leases.probe is None
+    with pytest.raises(TypeError):
+        Cluster.from_dict("demo", _cluster_dict(port_leases={"block_size": 0}))
@@ -0,0 +1,147 @@
+import pytest
+
+import seamless_config.cluster as cluster
+import seamless_config.select as select
+import seamless_config.tools as tools
+from seamless_config.config_files import load_tools
+
+
+def _define(queues=None, bufferdir="/buffers"):
+    cluster.define_clusters(
+        {
+            "mycluster": {
+                "type": "slurm",
+                "tunnel": False,
+                "frontends": [
+                    {
+                        "hostname": "frontend",
+                        "hashserver": {"bufferdir": bufferdir},
+                        "daskserver": {
+                            "network_interface": "eth0",
+                            "port_start": 60000,
+                            "port_end": 60100,
+                        },
+                    }
+                ],
+                "queues": queues
+                or {
+                    "short": {"conda": "seamless", "walltime": "01:00:00", "cores": 4},
+                    "long": {"conda": "seamless", "walltime": "24:00:00", "cores": 4},
+                },
+                "default_queue": "short",
+            }
+        }
+    )
+
+
+@pytest.fixture
+def selection(monkeypatch):
+    for name, value in (
+        ("_current_cluster", "mycluster"),
+        ("_current_project", "myproject"),
+        ("_current_subproject", None),
+        ("_current_stage", None),
+        ("_current_substage", None),
+        ("_current_queue", None),
+        ("_queue_source", None),
+        ("_queue_cluster", None),
+        ("_current_node", None),
+    ):
+        monkeypatch.setattr(select, name, value)
+    monkeypatch.setattr(cluster, "_local_cluster", None)
+    load_tools()
+    _define()
+    monkeypatch.setattr(tools, "_configure_cache_stats", {"hits": 0, "misses": 0})
+
+
+def test_configure_is_memoized(selection):
+    first = tools.configure_hashserver("rw")
+    first["hostname"] = "modified"
+    second = tools.configure_hashserver("rw")
+    assert second["hostname"] == "frontend"
+    tools.configure_hashserver("ro")
+    stats = tools.get_configure_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+
+
+def test_configure_cache_follows_selection(selection):
+    config = tools.configure_daskserver()
+    assert config["file_parameters"]["walltime"] == "01:00:00"
+    select.select_queue("long")
+    config = tools.configure_daskserver()
+    assert config["file_parameters"]["walltime"] == "24:00:00"
+    select.select_stage("prod")
+    config = tools.configure_hashserver("rw")
+    assert "STAGE-prod" in config["workdir"]
+    assert tools.get_configure_cache_stats()["hits"] == 0
+
+
+def test_pure_daskserver_cache_follows_selected_queue(selection, monkeypatch):
+    monkeypatch.setattr(select, "_current_queue_overrides", None)
+    select.select_queue_overrides({"walltime": "02:00:00"})
+    config = tools.configure_pure_daskserver(queue="long")
+    assert config["file_parameters"]["walltime"] == "24:00:00"
+    # Same explicit queue, but now it is the selected one: overrides apply
+    select.select_queue("long")
+    config = tools.configure_pure_daskserver(queue="long")
+    assert config["file_parameters"]["walltime"] == "02:00:00"
+    assert tools.get_configure_cache_stats()["hits"] == 0
+
+
+def test_configure_cache_invalidated_by_define_clusters(selection):
+    assert tools.configure_hashserver("rw")["workdir"].startswith("/buffers")
+    _define(bufferdir="/other-buffers")
+    assert tools.get_configure_cache_stats()["entries"] == 0
+    assert tools.configure_hashserver("rw")["workdir"].startswith("/other-buffers")
+
+
+def test_configure_jobserver_collects_remote_clients_on_change_only(
+    selection, monkeypatch
+):
+    import seamless_config.extern_clients as extern_clients
+    from seamless_remote import buffer_remote, database_remote
+
+    cluster.define_clusters(
+        {
+            "mycluster": {
+                "type": "slurm",
+                "workers": 4,
+                "frontends": [
+                    {
+                        "hostname": "frontend",
+                        "jobserver": {
+                            "conda": "seamless",
+                            "network_interface": "eth0",
+                            "port_start": 61000,
+                            "port_end": 61100,
+                        },
+                    }
+                ],
+            }
+        }
+    )
+    buffers = [{"name": "hash", "readonly": False, "url": "http://hash", "directory": None}]
+    monkeypatch.setattr(database_remote, "inspect_extern_clients", lambda: [])
+    monkeypatch.setattr(database_remote, "inspect_launched_clients", lambda: [])
+    monkeypatch.setattr(buffer_remote, "inspect_extern_clients", lambda: list(buffers))
+    monkeypatch.setattr(buffer_remote, "inspect_launched_clients", lambda: [])
+    collected = []
+    collect = extern_clients.collect_remote_clients
+
+    def collect_remote_clients(cluster_name):
+        collected.append(cluster_name)
+        return collect(cluster_name)
+
+    monkeypatch.setattr(extern_clients, "collect_remote_clients", collect_remote_clients)
+
+    config = tools.configure_jobserver()
+    assert config["file_parameters"]["buffer"][0]["url"] == "http://hash"
+    tools.configure_jobserver()
+    assert collected == ["mycluster"]
+
+    buffers[0] = {**buffers[0], "url": "http://other-hash"}
+    config = tools.configure_jobserver()
+    assert config["file_parameters"]["buffer"][0]["url"] == "http://other-hash"
+    assert collected == ["mycluster", "mycluster"]
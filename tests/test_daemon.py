@@ -0,0 +1,160 @@
+import sys
+import threading
+import types
+import warnings
+
+import pytest
+import yaml
+
+import seamless_config
+import seamless_config.select as select
+from seamless_config import daemon
+
+
+@pytest.fixture
+def workdir(monkeypatch, tmp_path):
+    monkeypatch.setattr(seamless_config, "_initialized", False)
+    monkeypatch.setattr(seamless_config, "_set_workdir_called", False)
+    monkeypatch.setattr(seamless_config, "_workdir", None)
+    monkeypatch.setattr(select, "_current_cluster", None)
+    monkeypatch.setattr(select, "_current_project", None)
+    monkeypatch.setattr(select, "_current_stage", None)
+    monkeypatch.setattr(select, "_current_substage", None)
+    monkeypatch.setattr(select, "_current_execution", "process")
+    monkeypatch.setattr(select, "_execution_source", None)
+    monkeypatch.setattr(select, "_execution_command_seen", False)
+    monkeypatch.setattr(select, "_current_persistent", None)
+    monkeypatch.setattr(select, "_persistent_source", None)
+    monkeypatch.setattr(select, "_persistent_command_seen", False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SEAMLESS_CACHE", raising=False)
+    monkeypatch.setattr(seamless_config, "change_stage", lambda: None)
+
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    (workdir / "seamless.yaml").write_text(
+        yaml.safe_dump([{"project": "myproject"}, {"execution": "process"}])
+    )
+    return workdir
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+    server = daemon.make_server()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _set_stage(workdir, stage=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        seamless_config.set_stage(stage, workdir=workdir)
+
+
+def test_no_daemon(monkeypatch, tmp_path):
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "missing.sock"))
+    assert daemon.request({"op": "ping"}) is None
+    monkeypatch.setenv(daemon.SOCKET_ENV, "")
+    assert daemon.socket_path() is None
+
+
+def test_ping(server):
+    response = daemon.request({"op": "ping"})
+    assert response["ok"]
+    response = daemon.request({"op": "nonsense"})
+    assert not response["ok"]
+    assert "Unknown operation" in response["error"]
+
+
+def test_set_stage_uses_daemon(server, workdir):
+    seamless_config.set_workdir(workdir)
+    fresh_state = select.get_selection_state()
+    _set_stage(workdir)
+    assert select.get_selected_project() == "myproject"
+    assert len(server.daemon._resolved) == 1
+    (entry,) = server.daemon._resolved.values()
+
+    # Another process with unchanged configuration files: the cached resolution is served
+    select.set_selection_state(fresh_state)
+    _set_stage(workdir)
+    assert select.get_selected_project() == "myproject"
+    assert len(server.daemon._resolved) == 1
+    assert next(iter(server.daemon._resolved.values())) is entry
+
+    (workdir / "seamless.yaml").write_text(
+        yaml.safe_dump([{"project": "otherproject"}, {"execution": "process"}])
+    )
+    select.set_selection_state(fresh_state)
+    _set_stage(workdir)
+    assert select.get_selected_project() == "otherproject"
+
+
+def test_launch_is_shared(server, monkeypatch):
+    import socket
+
+    calls = []
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    payload = {"hostname": "127.0.0.1", "port": listener.getsockname()[1]}
+
+    def run(config):
+        calls.append(config)
+        return payload
+
+    monkeypatch.setitem(
+        sys.modules, "remote_http_launcher", types.SimpleNamespace(run=run)
+    )
+    config = {"key": "hashserver-demo", "workdir": "/buffers"}
+    try:
+        assert daemon.launch(config) == payload
+        assert daemon.launch(dict(config)) == payload
+        assert len(calls) == 1
+        daemon.launch(config, refresh=True)
+        assert len(calls) == 2
+    finally:
+        listener.close()
+
+    # The server has exited: the cached payload is not handed out again
+    daemon.launch(config)
+    assert len(calls) == 3
+
+
+def test_launch_falls_back_when_daemon_hangs(monkeypatch, tmp_path):
+    import socket
+
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+    # Accepts connections, but never answers
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    monkeypatch.setattr(daemon, "LAUNCH_TIMEOUT", 0.1)
+    payload = {"hostname": "127.0.0.1", "port": 5813}
+    monkeypatch.setitem(
+        sys.modules,
+        "remote_http_launcher",
+        types.SimpleNamespace(run=lambda config: payload),
+    )
+    try:
+        assert daemon.launch({"key": "hashserver-demo"}) == payload
+    finally:
+        listener.close()
+
+
+def test_set_stage_without_daemon_creates_no_directory(monkeypatch, tmp_path, workdir):
+    import tempfile
+
+    monkeypatch.delenv(daemon.SOCKET_ENV, raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path / "tmp"))
+    seamless_config.set_workdir(workdir)
+    _set_stage(workdir)
+    assert select.get_selected_project() == "myproject"
+    assert not (tmp_path / "tmp").exists()
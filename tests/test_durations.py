@@ -0,0 +1,115 @@
+import pytest
+
+import seamless_config.cluster as cluster
+import seamless_config.select as select
+import seamless_config.tools as tools
+from seamless_config import durations
+from seamless_config.config_files import load_tools
+
+
+@pytest.fixture(autouse=True)
+def home(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def selection(monkeypatch):
+    for name, value in (
+        ("_current_cluster", "demo"),
+        ("_current_project", "myproject"),
+        ("_current_subproject", None),
+        ("_current_stage", None),
+        ("_current_substage", None),
+        ("_current_queue", None),
+        ("_queue_source", None),
+        ("_queue_cluster", None),
+        ("_current_node", None),
+        ("_current_queue_overrides", None),
+        ("_current_worker_pools", None),
+    ):
+        monkeypatch.setattr(select, name, value)
+    monkeypatch.setattr(cluster, "_local_cluster", None)
+    load_tools()
+
+
+def _define(**extra):
+    cluster.define_clusters(
+        {
+            "demo": {
+                "type": "slurm",
+                "frontends": [
+                    {
+                        "hostname": "frontend",
+                        "daskserver": {
+                            "network_interface": "eth0",
+                            "port_start": 60000,
+                            "port_end": 60100,
+                        },
+                    }
+                ],
+                "queues": {"default": {"conda": "seamless", "cores": 4}},
+                "default_queue": "default",
+                **extra,
+            }
+        }
+    )
+
+
+def test_durations_are_averaged_per_scope():
+    durations.record_duration("abc", 10.0, project="p", stage=None)
+    durations.record_duration("abc", 20.0, project="p", stage=None, alpha=0.5)
+    durations.record_durations({"abc": 100.0, "def": 1}, project="p", stage="big")
+    assert durations.get_duration_hints("p", None) == {"abc": 15.0}
+    assert durations.get_duration_hints("p", "big") == {"abc": 100.0, "def": 1.0}
+    assert durations.get_duration_hints("other", None) == {}
+    with pytest.raises(ValueError):
+        durations.record_duration("abc", -1, project="p")
+
+
+def test_hints_are_limited_to_recent_entries(monkeypatch):
+    for n, checksum in enumerate(("old", "middle", "new")):
+        monkeypatch.setattr(durations.time, "time", lambda n=n: 1000.0 + n)
+        durations.record_duration(checksum, 1.0, project="p")
+    hints = durations.get_duration_hints("p", None, max_entries=2)
+    assert sorted(hints) == ["middle", "new"]
+
+
+def test_configure_passes_duration_hints(selection):
+    durations.record_duration("abc", 42.0)
+    _define()
+    params = tools.configure_daskserver()["file_parameters"]
+    assert "task-durations" not in params
+
+    _define(task_durations=True)
+    params = tools.configure_daskserver()["file_parameters"]
+    assert params["task-durations"] == {"abc": 42.0}
+    # The pure Dask daskserver is shared by all projects and stages
+    params = tools.configure_pure_daskserver()["file_parameters"]
+    assert "task-durations" not in params
+
+    # New observations are picked up by memoized configurations
+    durations.record_duration("def", 1.0)
+    params = tools.configure_daskserver()["file_parameters"]
+    assert params["task-durations"] == {"abc": 42.0, "def": 1.0}
+
+
+def test_record_scheduler_durations(selection):
+    class Prefix:
+        def __init__(self, duration_average):
+            self.duration_average = duration_average
+
+    class Scheduler:
+        task_prefixes = {"transform": Prefix(3.0), "pending": Prefix(-1)}
+
+    class Client:
+        def run_on_scheduler(self, func):
+            return func(dask_scheduler=Scheduler())
+
+    class WrappingClient:
+        client = Client()
+
+    assert durations.record_scheduler_durations(Client()) == {"transform": 3.0}
+    durations.record_scheduler_durations(WrappingClient(), project="other")
+    assert durations.get_duration_hints("myproject", None) == {"transform": 3.0}
+    assert durations.get_duration_hints("other", None) == {"transform": 3.0}
@@ -34,6 +34,16 @@ def _reset_state(monkeypatch):
     monkeypatch.setattr(select, "_remote_source", None)
     monkeypatch.setattr(select, "_current_node", None)
     monkeypatch.setattr(select, "_node_source", None)
+    monkeypatch.setattr(select, "_current_memory_cache", None)
+    monkeypatch.setattr(select, "_memory_cache_source", None)
+    monkeypatch.setattr(select, "_current_activation", "lazy")
+    monkeypatch.setattr(select, "_activation_source", None)
+    monkeypatch.setattr(select, "_current_queue_overrides", None)
+    monkeypatch.setattr(select, "_queue_overrides_source", None)
+    monkeypatch.setattr(select, "_current_queue_routing", False)
+    monkeypatch.setattr(select, "_queue_routing_source", None)
+    monkeypatch.setattr(select, "_current_worker_pools", None)
+    monkeypatch.setattr(select, "_worker_pools_source", None)
 
 
 def _write_clusters_yaml(
@@ -303,6 +313,237 @@ def test_configure_daskserver_injects_selected_node_for_slurm(monkeypatch, tmp_p
     assert "--nodelist=node123" in directives
 
 
+def test_configure_daskserver_propagates_internal_port_range(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "internal-ports"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {"default": _queue_defaults()}
+    _write_clusters_yaml(tmp_path, queues, default_queue="default")
+    clusters_path = tmp_path / ".seamless" / "clusters.yaml"
+    cluster_def = yaml.safe_load(clusters_path.read_text(encoding="utf-8"))
+    cluster_def["demo"]["frontends"][0]["daskserver"].update(
+        {"internal_port_start": 40000, "internal_port_end": 40199}
+    )
+    clusters_path.write_text(yaml.safe_dump(cluster_def), encoding="utf-8")
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    import seamless_config.tools as tools
+
+    config = tools.configure_daskserver(cluster="demo", project="demo")
+    assert config["file_parameters"]["internal-port-range"] == "40000:40199"
+    config = tools.configure_pure_daskserver(cluster="demo")
+    assert config["file_parameters"]["internal-port-range"] == "40000:40199"
+
+
+def test_configure_daskserver_propagates_transformation_throttle(
+    monkeypatch, tmp_path
+):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "throttle"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {
+        "default": _queue_defaults()
+        | {"transformation_throttle": 2000, "transformation_throttle_per_worker": 20},
+        "unthrottled": {"TEMPLATE": "default", "transformation_throttle": None},
+    }
+    _write_clusters_yaml(tmp_path, queues, default_queue="default")
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    import seamless_config.tools as tools
+
+    params = tools.configure_daskserver(cluster="demo", project="demo")[
+        "file_parameters"
+    ]
+    assert params["transformation_throttle"] == 2000
+    assert params["transformation_throttle_per_worker"] == 20
+
+    select.select_cluster("demo")
+    select.select_queue("unthrottled")
+    params = tools.configure_daskserver(project="demo")["file_parameters"]
+    assert "transformation_throttle" not in params
+    assert params["transformation_throttle_per_worker"] == 20
+
+
+def test_transformation_throttle_must_be_positive():
+    from seamless_config.cluster import Cluster
+
+    queue = _queue_defaults() | {"transformation_throttle": 0}
+    with pytest.raises(TypeError):
+        Cluster.from_dict(
+            "demo",
+            {"type": "local", "frontends": [], "queues": {"default": queue}},
+        )
+
+
+def test_configure_daskserver_includes_spillover_queues(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "spillover"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {
+        "default": _queue_defaults()
+        | {"spillover": ["other"], "spillover_pending_time": "5m"},
+        "other": _queue_defaults() | {"cores": 4, "maximum_jobs": 10},
+    }
+    _write_clusters_yaml(tmp_path, queues, default_queue="default")
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    import seamless_config.tools as tools
+
+    select.select_cluster("demo")
+    for configure in (tools.configure_daskserver, tools.configure_pure_daskserver):
+        kwargs = {"project": "demo"} if configure is tools.configure_daskserver else {}
+        params = configure(**kwargs)["file_parameters"]
+        assert params["maximum_jobs"] == 1
+        assert params["spillover_pending_time"] == 300
+        (secondary,) = params["spillover"]
+        assert secondary["queue"] == "other"
+        assert secondary["cores"] == 4
+        assert secondary["maximum_jobs"] == 10
+
+    select.select_queue("other")
+    params = tools.configure_daskserver(project="demo")["file_parameters"]
+    assert "spillover" not in params
+
+
+def test_spillover_queues_are_validated():
+    from seamless_config.cluster import Cluster
+
+    def define(queues):
+        return Cluster.from_dict(
+            "demo", {"type": "local", "frontends": [], "queues": queues}
+        )
+
+    with pytest.raises(TypeError, match="unknown spillover queue 'missing'"):
+        define({"default": _queue_defaults() | {"spillover": ["missing"]}})
+    with pytest.raises(TypeError, match="itself"):
+        define({"default": _queue_defaults() | {"spillover": ["default"]}})
+    with pytest.raises(TypeError, match="same conda"):
+        define(
+            {
+                "default": _queue_defaults() | {"spillover": ["other"]},
+                "other": _queue_defaults() | {"conda": "other-env"},
+            }
+        )
+
+
+def test_worker_pools_command(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "worker-pools"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {
+        "cpu": _queue_defaults() | {"cores": 8},
+        "gpu": _queue_defaults() | {"dask_resources": {"GPU": 1}},
+    }
+    _write_clusters_yaml(tmp_path, queues, default_queue="cpu")
+    (workdir / "seamless.yaml").write_text(
+        yaml.safe_dump(
+            [
+                {"cluster": "demo"},
+                {"project": "demo"},
+                {"stage pipeline": [{"worker_pools": ["cpu", "gpu"]}]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+    import seamless_config.tools as tools
+
+    load_config_files()
+    plain = tools.configure_pure_daskserver()
+    assert "worker_pools" not in plain["file_parameters"]
+
+    select.select_stage("pipeline")
+    load_config_files()
+    assert select.get_worker_pools() == ["cpu", "gpu"]
+    for config in (tools.configure_daskserver(), tools.configure_pure_daskserver()):
+        params = config["file_parameters"]
+        assert params["cores"] == 8
+        assert params["dask-resources"] == {"pool-cpu": 1_000_000}
+        (pool,) = params["worker_pools"]
+        assert pool["queue"] == "gpu"
+        assert pool["dask-resources"] == {"GPU": 1, "pool-gpu": 1_000_000}
+    # The pure daskserver with worker pools is a different server
+    assert tools.configure_pure_daskserver()["key"] != plain["key"]
+
+    select.select_worker_pools(["missing"])
+    with pytest.raises(seamless_config.ConfigurationError, match="no queue 'missing'"):
+        tools.configure_daskserver()
+    with pytest.raises(ValueError):
+        select.select_worker_pools("gpu")
+
+
+def test_configure_daskserver_propagates_adaptive_scaling(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "adaptive"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {
+        "default": _queue_defaults()
+        | {
+            "maximum_jobs": 20,
+            "minimum_jobs": 2,
+            "adapt_interval": "2s",
+            "adapt-wait-count": 5,
+            "target_utilization": 0.8,
+        },
+        "static": _queue_defaults(),
+    }
+    _write_clusters_yaml(tmp_path, queues, default_queue="default")
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    import seamless_config.tools as tools
+
+    select.select_cluster("demo")
+    for configure in (tools.configure_daskserver, tools.configure_pure_daskserver):
+        kwargs = {"project": "demo"} if configure is tools.configure_daskserver else {}
+        params = configure(**kwargs)["file_parameters"]
+        assert params["maximum_jobs"] == 20
+        assert params["minimum_jobs"] == 2
+        assert params["adapt_interval"] == 2
+        assert params["adapt_wait_count"] == 5
+        assert params["target_utilization"] == 0.8
+
+    select.select_queue("static")
+    params = tools.configure_daskserver(project="demo")["file_parameters"]
+    assert "minimum_jobs" not in params
+    assert "adapt_interval" not in params
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"minimum_jobs": -1},
+        {"minimum_jobs": 5, "maximum_jobs": 2},
+        {"adapt_interval": "0s"},
+        {"adapt_interval": "often"},
+        {"adapt_wait_count": 0},
+        {"target_utilization": 1.5},
+    ],
+)
+def test_adaptive_scaling_is_validated(fields):
+    from seamless_config.cluster import Cluster
+
+    queue = _queue_defaults() | fields
+    with pytest.raises(TypeError):
+        Cluster.from_dict(
+            "demo",
+            {"type": "local", "frontends": [], "queues": {"default": queue}},
+        )
+
+
 def test_remote_execution_requires_cluster(monkeypatch, tmp_path):
     _reset_state(monkeypatch)
     workdir = tmp_path / "remote-execution"
@@ -518,3 +759,142 @@ def test_remote_redundancy_returns_daskserver(monkeypatch, tmp_path):
     seamless_config.init()
 
     assert select.check_remote_redundancy("demo") == "daskserver"
+
+
+def test_activation_command(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "activation"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (workdir / "seamless.yaml").write_text(
+        "- execution: process\n- activation: prewarm\n", encoding="utf-8"
+    )
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    assert select.get_activation() == "prewarm"
+
+    (workdir / "seamless.yaml").write_text(
+        "- execution: process\n- activation: later\n", encoding="utf-8"
+    )
+    with pytest.raises(ValueError):
+        load_config_files()
+
+
+def test_queue_overrides_command(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "queue-overrides"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    queues = {
+        "default": _queue_defaults() | {"worker_threads": 2},
+        "other": _queue_defaults() | {"worker_threads": 2},
+    }
+    _write_clusters_yaml(tmp_path, queues, default_queue="default")
+    (workdir / "seamless.yaml").write_text(
+        yaml.safe_dump(
+            [
+                {"cluster": "demo"},
+                {"project": "demo"},
+                {"queue_overrides": {"worker_threads": 8, "maximum-jobs": 4}},
+                {"stage big": [{"queue_overrides": {"maximum_jobs": 50}}]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+    import seamless_config.tools as tools
+
+    load_config_files()
+    params = tools.configure_daskserver()["file_parameters"]
+    assert params["worker_threads"] == 8
+    assert params["maximum_jobs"] == 4
+
+    select.select_stage("big")
+    load_config_files()
+    params = tools.configure_daskserver()["file_parameters"]
+    assert params["worker_threads"] == 8
+    assert params["maximum_jobs"] == 50
+    params = tools.configure_pure_daskserver()["file_parameters"]
+    assert params["maximum_jobs"] == 50
+    # A routed queue is launched as defined
+    params = tools.configure_pure_daskserver(queue="other")["file_parameters"]
+    assert params["worker_threads"] == 2
+
+    # The cluster definition itself is unchanged
+    from seamless_config.cluster import get_cluster
+
+    assert get_cluster("demo").queues["default"].worker_threads == 2
+
+
+def test_queue_overrides_command_rejects_unknown_fields(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "queue-overrides-invalid"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (workdir / "seamless.yaml").write_text(
+        "- queue_overrides:\n    worker_treads: 8\n", encoding="utf-8"
+    )
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    with pytest.raises(ValueError, match="unknown queue field 'worker_treads'"):
+        load_config_files()
+
+
+def test_queue_routing_command(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "queue-routing"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (workdir / "seamless.yaml").write_text(
+        "- queue_routing: true\n- stage plain:\n  - queue_routing: false\n",
+        encoding="utf-8",
+    )
+    seamless_config.set_workdir(workdir)
+    from seamless_config.config_files import load_config_files
+
+    load_config_files()
+    assert select.get_queue_routing() is True
+    select.select_stage("plain")
+    load_config_files()
+    assert select.get_queue_routing() is False
+
+    (workdir / "seamless.yaml").write_text("- queue_routing: yes please\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="expects a boolean"):
+        load_config_files()
+
+
+def test_memory_cache_command_bounds_buffer_cache(monkeypatch, tmp_path):
+    import seamless_config.memory_cache as memory_cache
+
+    _reset_state(monkeypatch)
+    activated = []
+    monkeypatch.setattr(memory_cache, "activate", activated.append)
+    workdir = tmp_path / "memory-cache"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (workdir / "seamless.yaml").write_text(
+        "- execution: process\n- persistent: false\n- memory_cache: 4GB\n",
+        encoding="utf-8",
+    )
+    seamless_config.set_workdir(workdir)
+    seamless_config.init()
+
+    assert select.get_memory_cache_size() == 4 * 10**9
+    assert activated == [4 * 10**9]
+
+
+def test_memory_cache_command_rejects_invalid_size(monkeypatch, tmp_path):
+    _reset_state(monkeypatch)
+    workdir = tmp_path / "memory-cache-invalid"
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (workdir / "seamless.yaml").write_text(
+        "- execution: process\n- memory_cache: lots\n", encoding="utf-8"
+    )
+    seamless_config.set_workdir(workdir)
+    with pytest.raises(ValueError):
+        seamless_config.init()
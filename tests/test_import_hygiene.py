@@ -1,6 +1,8 @@
 import importlib
 import sys
 
+import pytest
+
 
 def _purge(prefix: str) -> None:
     for name in list(sys.modules):
@@ -8,6 +10,16 @@ def _purge(prefix: str) -> None:
             sys.modules.pop(name, None)
 
 
+@pytest.fixture(autouse=True)
+def _restore_modules():
+    # Other test modules hold references to the original modules
+    saved = dict(sys.modules)
+    yield
+    for name in set(sys.modules) - set(saved):
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
 def test_import_seamless_config_does_not_load_optional_modules():
     for mod in ("seamless_config", "seamless_remote", "seamless_transformer", "seamless"):
         _purge(mod)
@@ -17,3 +29,51 @@ def test_import_seamless_config_does_not_load_optional_modules():
     assert "seamless_remote" not in sys.modules
     assert "seamless_transformer" not in sys.modules
     assert "seamless" not in sys.modules
+
+
+# Modules that the worker bootstrap import must not load
+WORKER_BOOTSTRAP = "from seamless_config.extern_clients import set_remote_clients_from_env"
+MODULE_BUDGET = 45
+FORBIDDEN_MODULES = (
+    "yaml",
+    "inspect",
+    "dataclasses",
+    "seamless_remote",
+    "seamless",
+    "distributed",
+    "seamless_config.tools",
+    "seamless_config.cluster",
+    "seamless_config.config_files",
+)
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Run statement in a fresh interpreter; return the modules that it imported."""
+    import os
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = (
+        "import sys; before = set(sys.modules); "
+        + statement
+        + "; print('\\n'.join(sorted(set(sys.modules) - before)))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=root,
+    )
+    return set(proc.stdout.split())
+
+
+def test_worker_bootstrap_imports():
+    modules = _imported_modules(WORKER_BOOTSTRAP)
+    for name in FORBIDDEN_MODULES:
+        assert name not in modules, name
+    assert len(modules) <= MODULE_BUDGET, sorted(modules)
+
+
+def test_config_files_does_not_import_yaml():
+    assert "yaml" not in _imported_modules("import seamless_config.config_files")
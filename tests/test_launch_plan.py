@@ -0,0 +1,136 @@
+import sys
+import types
+
+import pytest
+import yaml
+
+import seamless_config
+import seamless_config.select as select
+from seamless_config import launch_plan
+
+
+@pytest.fixture
+def project(monkeypatch, tmp_path):
+    monkeypatch.setattr(seamless_config, "_initialized", False)
+    monkeypatch.setattr(seamless_config, "_set_workdir_called", False)
+    monkeypatch.setattr(seamless_config, "_workdir", None)
+    for name, value in (
+        ("_current_cluster", None),
+        ("_current_project", None),
+        ("_current_subproject", None),
+        ("_current_stage", None),
+        ("_current_substage", None),
+        ("_current_execution", "process"),
+        ("_execution_source", None),
+        ("_execution_command_seen", False),
+        ("_current_persistent", None),
+        ("_persistent_source", None),
+        ("_persistent_command_seen", False),
+        ("_current_queue", None),
+        ("_queue_source", None),
+        ("_queue_cluster", None),
+        ("_current_remote", None),
+        ("_remote_source", None),
+    ):
+        monkeypatch.setattr(select, name, value)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SEAMLESS_CACHE", raising=False)
+
+    clusters_dir = tmp_path / ".seamless"
+    clusters_dir.mkdir()
+    clusters = {
+        "demo": {
+            "type": "local",
+            "tunnel": False,
+            "workers": 2,
+            "frontends": [
+                {
+                    "hostname": "frontend",
+                    "hashserver": {"bufferdir": "/buffers"},
+                    "database": {"database_dir": "/db"},
+                    "daskserver": {
+                        "network_interface": "lo",
+                        "port_start": 3100,
+                        "port_end": 3110,
+                    },
+                }
+            ],
+            "queues": {"default": {"conda": "base", "walltime": "00:10:00"}},
+            "default_queue": "default",
+        }
+    }
+    (clusters_dir / "clusters.yaml").write_text(yaml.safe_dump(clusters))
+
+    workdir = tmp_path / "workdir"
+    workdir.mkdir()
+    commands = [
+        {"cluster": "demo"},
+        {"project": "myproject"},
+        {"execution": "process"},
+        {"stage build": [{"execution": "remote"}]},
+        {"stage prod": [{"execution": "remote"}]},
+    ]
+    (workdir / "seamless.yaml").write_text(yaml.safe_dump(commands))
+    seamless_config.set_workdir(workdir)
+    return workdir
+
+
+def test_find_stages(project):
+    assert launch_plan.find_stages() == ["build", "prod"]
+
+
+def test_plan_launches_deduplicates(project):
+    plan = launch_plan.plan_launches(
+        [None, "build", ("build", "sub1"), ("build", "sub2"), "prod"]
+    )
+    by_tool = {}
+    for entry in plan:
+        by_tool.setdefault(entry["tool"], []).append(entry)
+
+    # One hashserver/database per stage; substages share those of their stage
+    assert len(by_tool["hashserver"]) == 3
+    assert len(by_tool["database"]) == 3
+    build_hashserver = [
+        entry for entry in by_tool["hashserver"] if "STAGE-build" in entry["key"]
+    ]
+    assert build_hashserver[0]["stages"] == [
+        ("build", None),
+        ("build", "sub1"),
+        ("build", "sub2"),
+    ]
+    # Dask servers are per substage, and only for the remote stages
+    assert len(by_tool["daskserver"]) == 4
+    assert "jobserver" not in by_tool
+
+    # The stage selection is restored
+    assert select.get_stage() is None
+    assert select.get_substage() is None
+
+
+def test_plan_launches_default_stages(project):
+    plan = launch_plan.plan_launches()
+    stages = {stage for entry in plan for stage, _ in entry["stages"]}
+    assert stages == {None, "build", "prod"}
+
+
+def test_prelaunch(project, monkeypatch):
+    launched = []
+
+    def run(config):
+        launched.append(config["key"])
+        if config["key"].startswith("database"):
+            raise RuntimeError("launch failed")
+        return {"port": 1234}
+
+    monkeypatch.setitem(
+        sys.modules, "remote_http_launcher", types.SimpleNamespace(run=run)
+    )
+    plan = launch_plan.plan_launches([None, "build"])
+    results = launch_plan.prelaunch(plan)
+    assert sorted(launched) == sorted(entry["key"] for entry in plan)
+    for entry in plan:
+        result = results[entry["key"]]
+        if entry["tool"] == "database":
+            assert isinstance(result, RuntimeError)
+        else:
+            assert result == {"port": 1234}
@@ -0,0 +1,127 @@
+import sys
+import threading
+import types
+
+from seamless_config.extern_clients import LazySeamlessDaskClient
+
+
+def _install_fake_dask(monkeypatch, connections):
+    distributed = types.ModuleType("distributed")
+
+    class Client:
+        def __init__(self, address, **kwargs):
+            connections.append(address)
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    distributed.Client = Client
+
+    seamless_dask = types.ModuleType("seamless_dask")
+    seamless_dask_client = types.ModuleType("seamless_dask.client")
+
+    class SeamlessDaskClient:
+        def __init__(self, client, worker_plugin_workers):
+            self.client = client
+            self.workers = worker_plugin_workers
+
+        def submit(self, value):
+            return value
+
+    seamless_dask_client.SeamlessDaskClient = SeamlessDaskClient
+    monkeypatch.setitem(sys.modules, "distributed", distributed)
+    monkeypatch.setitem(sys.modules, "seamless_dask", seamless_dask)
+    monkeypatch.setitem(sys.modules, "seamless_dask.client", seamless_dask_client)
+
+
+def test_lazy_client_connects_once_on_first_use(monkeypatch):
+    connections = []
+    _install_fake_dask(monkeypatch, connections)
+
+    client = LazySeamlessDaskClient("tcp://scheduler:8786", 4)
+    assert not client.connected
+    assert connections == []
+
+    threads = [
+        threading.Thread(target=lambda: client.submit(1)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.connected
+    assert connections == ["tcp://scheduler:8786"]
+    assert client.workers == 4
+
+
+def test_lazy_client_retries_and_warns(monkeypatch):
+    import pytest
+
+    import seamless_config.retry as retry
+
+    connections = []
+    _install_fake_dask(monkeypatch, connections)
+    distributed = sys.modules["distributed"]
+
+    class FailingClient:
+        def __init__(self, address, **kwargs):
+            connections.append(address)
+            raise OSError("scheduler down")
+
+    monkeypatch.setattr(distributed, "Client", FailingClient)
+
+    client = LazySeamlessDaskClient("tcp://scheduler:8786", 1, {"max_attempts": 3})
+    locked_during_delay = []
+    monkeypatch.setattr(
+        retry.time, "sleep", lambda delay: locked_during_delay.append(client._lock.locked())
+    )
+    with pytest.warns(UserWarning, match="Dask scheduler"):
+        with pytest.raises(OSError):
+            client.submit(1)
+    assert len(connections) == 3
+    assert locked_during_delay == [False, False]
+
+
+def test_lazy_client_is_inspected_and_closed_without_connecting(monkeypatch):
+    connections = []
+    _install_fake_dask(monkeypatch, connections)
+
+    with LazySeamlessDaskClient("tcp://scheduler:8786", 1) as client:
+        # As inspected by seamless-dask when the client is registered
+        assert getattr(client, "_dummy_dask_client", None) is None
+        assert getattr(client, "client", None) is None
+        assert "not connected" in repr(client)
+    assert connections == []
+
+    client.submit(1)
+    dask_client = client.client
+    client.close()
+    assert dask_client.closed
+    assert not client.connected
+
+
+def test_lazy_clients_are_keyed_by_configuration(monkeypatch):
+    import seamless_config.extern_clients as extern_clients
+
+    installed = []
+    transformer_client = types.ModuleType("seamless_dask.transformer_client")
+    transformer_client.get_seamless_dask_client = lambda: None
+    transformer_client.set_seamless_dask_client = installed.append
+    seamless = types.ModuleType("seamless")
+    seamless.is_worker = lambda: False
+    monkeypatch.setitem(sys.modules, "seamless", seamless)
+    monkeypatch.setitem(sys.modules, "seamless_dask", types.ModuleType("seamless_dask"))
+    monkeypatch.setitem(
+        sys.modules, "seamless_dask.transformer_client", transformer_client
+    )
+    monkeypatch.setattr(extern_clients, "_lazy_dask_clients", {})
+    monkeypatch.setenv("SEAMLESS_DASK_SCHEDULER", "tcp://scheduler:8786")
+
+    for workers in ("1", "4", "4"):
+        monkeypatch.setenv("SEAMLESS_DASK_WORKERS", workers)
+        extern_clients._configure_dask_client_from_env()
+    assert installed[1] is not installed[0]
+    assert installed[2] is installed[1]
+    assert installed[1]._worker_count == 4
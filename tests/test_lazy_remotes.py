@@ -0,0 +1,75 @@
+import threading
+import types
+
+import seamless_config
+import seamless_config.cluster as cluster
+import seamless_config.retry as retry
+from seamless_config import lazy_remotes
+
+
+def test_prewarm_runs_initializers_in_background():
+    calls = []
+    thread = lazy_remotes.prewarm(
+        [lambda: calls.append("buffer"), lambda: calls.append("database")]
+    )
+    thread.join(5)
+    assert calls == ["buffer", "database"]
+
+
+def test_prewarm_ignores_errors():
+    calls = []
+
+    def failing_buffer():
+        raise ConnectionError("hashserver not reachable")
+
+    thread = lazy_remotes.prewarm([failing_buffer, lambda: calls.append("database")])
+    thread.join(5)
+    assert calls == ["database"]
+
+
+def test_clear_stops_a_running_prewarm():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_buffer():
+        started.set()
+        release.wait(5)
+        calls.append("buffer")
+
+    thread = lazy_remotes.prewarm([slow_buffer, lambda: calls.append("database")])
+    assert started.wait(5)
+    # clear() does not wait for the running launch
+    lazy_remotes.clear()
+    release.set()
+    thread.join(5)
+    assert calls == ["buffer"]
+
+
+def test_initializers_retry_connection_errors(monkeypatch):
+    clus = cluster.Cluster.from_dict(
+        "demo",
+        {
+            "type": "slurm",
+            "frontends": [{"hostname": "frontend"}],
+            "connect_policy": {"max_attempts": 3},
+        },
+    )
+    monkeypatch.setattr(cluster, "get_cluster", lambda name: clus)
+    monkeypatch.setattr(retry.time, "sleep", lambda delay: None)
+    retry.reset_connect_metrics()
+    calls = []
+
+    def ensure_initialized():
+        calls.append(None)
+        if len(calls) < 3:
+            raise ConnectionRefusedError("hashserver not reachable")
+
+    module = types.SimpleNamespace(
+        __name__="seamless_remote.buffer_remote", ensure_initialized=ensure_initialized
+    )
+    (initialize,) = seamless_config._remote_initializers("demo", [module])
+    assert calls == []
+    initialize()
+    assert len(calls) == 3
+    assert retry.get_connect_metrics()["buffer"]["successes"] == 1
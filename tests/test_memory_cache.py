@@ -0,0 +1,54 @@
+import sys
+import types
+
+import seamless_config.memory_cache as memory_cache
+from seamless_config.units import parse_size
+
+
+def test_parse_size_units():
+    assert parse_size(1000) == 1000
+    assert parse_size("4GB") == 4 * 10**9
+    assert parse_size("512 MiB") == 512 * 2**20
+    assert parse_size("1.5k") == 1500
+
+
+def _install_fake_buffer_cache(monkeypatch):
+    class BufferCache:
+        soft_cap = 5 * 1024**3
+        hard_cap = 50 * 1024**3
+        evictions = 0
+
+        def run_eviction_once(self):
+            self.evictions += 1
+
+    cache = BufferCache()
+    module = types.ModuleType("seamless.caching.buffer_cache")
+    module.get_buffer_cache = lambda: cache
+    monkeypatch.setitem(sys.modules, "seamless", types.ModuleType("seamless"))
+    monkeypatch.setitem(
+        sys.modules, "seamless.caching", types.ModuleType("seamless.caching")
+    )
+    monkeypatch.setitem(sys.modules, "seamless.caching.buffer_cache", module)
+    monkeypatch.setattr(memory_cache, "_evictor", None)
+    monkeypatch.setattr(memory_cache, "_default_caps", None)
+    return cache
+
+
+def test_memory_cache_bounds_buffer_cache(monkeypatch):
+    cache = _install_fake_buffer_cache(monkeypatch)
+    monkeypatch.setattr(memory_cache, "EVICTION_INTERVAL", 0.01)
+    assert memory_cache.activate(4 * 10**9)
+    assert cache.soft_cap == cache.hard_cap == 4 * 10**9
+    evictor = memory_cache._evictor
+    evictor.join(0.1)
+    assert cache.evictions > 1
+
+    memory_cache.deactivate()
+    evictor.join()
+    assert (cache.soft_cap, cache.hard_cap) == (5 * 1024**3, 50 * 1024**3)
+    assert memory_cache._evictor is None
+
+
+def test_memory_cache_needs_seamless(monkeypatch):
+    monkeypatch.setitem(sys.modules, "seamless.caching.buffer_cache", None)
+    assert not memory_cache.activate(10**9)
@@ -0,0 +1,128 @@
+import socket
+
+import pytest
+
+import seamless_config.cluster as cluster
+import seamless_config.select as select
+import seamless_config.tools as tools
+from seamless_config import ports
+from seamless_config.config_files import load_tools
+
+
+@pytest.fixture(autouse=True)
+def home(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(ports, "_leased", {})
+    return tmp_path
+
+
+def test_leases_do_not_overlap():
+    first = ports.lease_ports("host:5000-5029", "a", 5000, 5029, block_size=10, ttl=60)
+    second = ports.lease_ports("host:5000-5029", "b", 5000, 5029, block_size=10, ttl=60)
+    assert first == (5000, 5009)
+    assert second == (5010, 5019)
+    # The same key gets the same block back
+    assert ports.lease_ports("host:5000-5029", "a", 5000, 5029, block_size=10, ttl=60) == first
+    assert ports.lease_ports("host:5000-5029", "c", 5000, 5029, block_size=10, ttl=60) == (5020, 5029)
+    assert ports.lease_ports("host:5000-5029", "d", 5000, 5029, block_size=10, ttl=60) is None
+
+    ports.release_ports("host:5000-5029", "b")
+    assert ports.lease_ports("host:5000-5029", "d", 5000, 5029, block_size=10, ttl=60) == second
+
+
+def test_leases_expire(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(ports.time, "time", lambda: now)
+    ports.lease_ports("pool", "a", 5000, 5001, block_size=2, ttl=10)
+    assert ports.lease_ports("pool", "b", 5000, 5001, block_size=2, ttl=10) is None
+    now = 1011.0
+    assert ports.lease_ports("pool", "b", 5000, 5001, block_size=2, ttl=10) == (5000, 5001)
+
+
+def test_leases_are_cached_until_renewal(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(ports.time, "time", lambda: now)
+    block = ports.lease_ports("pool", "a", 5000, 5009, block_size=5, ttl=10)
+    opened = []
+    lease_file_class = ports.LockedJsonFile
+
+    def counting_lease_file(path):
+        opened.append(path)
+        return lease_file_class(path)
+
+    monkeypatch.setattr(ports, "LockedJsonFile", counting_lease_file)
+    now = 1004.0
+    assert ports.lease_ports("pool", "a", 5000, 5009, block_size=5, ttl=10) == block
+    assert opened == []
+    # After half the time-to-live, the lease is renewed in the lease file
+    now = 1006.0
+    assert ports.lease_ports("pool", "a", 5000, 5009, block_size=5, ttl=10) == block
+    assert len(opened) == 1
+    now = 1014.0
+    assert ports.lease_ports("pool", "b", 5000, 5009, block_size=5, ttl=10) == (5005, 5009)
+
+
+def test_reused_payload_renews_lease(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(ports.time, "time", lambda: now)
+    block = ports.lease_ports("pool", "a", 5000, 5001, block_size=2, ttl=10)
+    config = {"key": "a", "port_start": block[0], "port_end": block[1]}
+    now = 1004.0
+    ports.renew_lease(config)
+    # Renewed from the lease file, even without the in-process cache
+    monkeypatch.setattr(ports, "_leased", {})
+    now = 1008.0
+    ports.renew_lease(config)
+    now = 1015.0
+    assert ports.lease_ports("pool", "b", 5000, 5001, block_size=2, ttl=10) is None
+    # Unleased blocks are left alone
+    ports.renew_lease({"key": "c", "port_start": 6000, "port_end": 6001})
+
+
+def test_probing_skips_ports_in_use():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        sock.listen()
+        busy = sock.getsockname()[1]
+        block = ports.lease_ports(
+            "local", "a", busy, busy + 1, block_size=1, ttl=60, probe_host=""
+        )
+    assert block == (busy + 1, busy + 1)
+
+
+def test_configure_uses_leased_ports(monkeypatch):
+    monkeypatch.setattr(select, "_current_cluster", "demo")
+    monkeypatch.setattr(select, "_current_project", "myproject")
+    monkeypatch.setattr(select, "_current_subproject", None)
+    monkeypatch.setattr(select, "_current_stage", None)
+    monkeypatch.setattr(select, "_current_substage", None)
+    monkeypatch.setattr(cluster, "_local_cluster", None)
+    load_tools()
+    cluster.define_clusters(
+        {
+            "demo": {
+                "type": "slurm",
+                "port_leases": {"block_size": 4},
+                "frontends": [
+                    {
+                        "hostname": "frontend",
+                        "hashserver": {
+                            "bufferdir": "/buffers",
+                            "port_start": 6000,
+                            "port_end": 6099,
+                        },
+                        "database": {
+                            "database_dir": "/db",
+                            "port_start": 6000,
+                            "port_end": 6099,
+                        },
+                    }
+                ],
+            }
+        }
+    )
+    hashserver = tools.configure_hashserver("rw")
+    database = tools.configure_database("rw")
+    assert (hashserver["port_start"], hashserver["port_end"]) == (6000, 6003)
+    assert (database["port_start"], database["port_end"]) == (6004, 6007)
+    assert tools.configure_hashserver("rw")["port_start"] == 6000
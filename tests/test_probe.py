@@ -0,0 +1,58 @@
+import seamless_config.probe as probe
+
+
+def test_order_clients_prefers_healthy_local_fast(monkeypatch):
+    latencies = {
+        "http://slow": 0.5,
+        "http://fast": 0.01,
+        "http://dead": None,
+        "/buffers": 0.001,
+    }
+    monkeypatch.setattr(
+        probe, "probe_client", lambda kind, location, timeout: latencies[location]
+    )
+    candidates = [
+        ("dead", "url", "http://dead"),
+        ("slow", "url", "http://slow"),
+        ("fast", "url", "http://fast"),
+        ("dir", "directory", "/buffers"),
+    ]
+    order, measured = probe.order_clients(candidates, timeout=1)
+    assert order == ["dir", "fast", "slow", "dead"]
+    assert measured["dead"] is None
+
+
+def test_probe_client_directory(tmp_path):
+    assert probe.probe_client("directory", str(tmp_path), 1) is not None
+    assert probe.probe_client("directory", str(tmp_path / "missing"), 1) is None
+
+
+def test_prober_records_health_until_stopped(monkeypatch):
+    healthy = {"http://db": False}
+    monkeypatch.setattr(
+        probe,
+        "probe_client",
+        lambda kind, location, timeout: 0.01 if healthy[location] else None,
+    )
+    prober = probe.start_prober([("db", "url", "http://db")], timeout=1, interval=0.01)
+    try:
+        for _ in range(200):
+            if probe.get_unhealthy_clients():
+                break
+            prober.join(0.01)
+        assert probe.get_unhealthy_clients() == {"db"}
+    finally:
+        probe.stop_probers()
+    assert prober.stopped
+    assert probe.get_unhealthy_clients() == set()
+
+
+def test_probe_client_accepts_client_errors(monkeypatch):
+    import urllib.error
+    import urllib.request
+
+    def urlopen(url, timeout):
+        raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+    assert probe.probe_client("url", "http://db", 1) is not None
@@ -33,3 +33,88 @@ def test_collect_remote_clients_writes_json(tmp_path, monkeypatch):
     loaded = json.loads(path.read_text(encoding="utf-8"))
     print(loaded)
     assert loaded == data
+
+
+def test_collect_remote_clients_shared_filesystem(monkeypatch):
+    import seamless_config.cluster as cluster
+    import seamless_config.select as select
+    from seamless_config.config_files import load_tools
+
+    load_tools()
+    cluster.define_clusters(
+        {
+            "shared": {
+                "type": "slurm",
+                "frontends": [
+                    {
+                        "hostname": "frontend",
+                        "hashserver": {
+                            "bufferdir": "/shared/buffers",
+                            "shared_filesystem": True,
+                        },
+                    }
+                ],
+            }
+        }
+    )
+    # The directories come from the launched clients, not from the selection
+    monkeypatch.setattr(select, "_current_project", "otherproject")
+    monkeypatch.setattr(select, "_current_subproject", None)
+    monkeypatch.setattr(select, "_current_stage", None)
+
+    launched = [
+        {
+            "cluster": "shared",
+            "readonly": False,
+            "url": "http://localhost:5000",
+            "remote_url": "http://frontend:5000",
+            "remote_directory": "/shared/buffers/myproject/STAGE-prod",
+        },
+        # Same buffer directory, through a read-only server
+        {
+            "cluster": "shared",
+            "readonly": True,
+            "url": "http://localhost:5001",
+            "remote_url": "http://frontend:5001",
+            "remote_directory": "/shared/buffers/myproject/STAGE-prod",
+        },
+        # A read-only client does not report its directory
+        {
+            "cluster": "shared",
+            "readonly": True,
+            "url": "http://localhost:5002",
+            "remote_url": "http://frontend:5002",
+        },
+    ]
+
+    from seamless_remote import database_remote, buffer_remote
+
+    monkeypatch.setattr(database_remote, "inspect_extern_clients", lambda: [])
+    monkeypatch.setattr(database_remote, "inspect_launched_clients", lambda: [])
+    monkeypatch.setattr(buffer_remote, "inspect_extern_clients", lambda: [])
+    monkeypatch.setattr(buffer_remote, "inspect_launched_clients", lambda: launched)
+
+    result = collect_remote_clients("shared")
+    assert result["buffer"] == [
+        {
+            "readonly": True,
+            "remote_directory": "/shared/buffers/myproject/STAGE-prod",
+        },
+        {
+            "readonly": False,
+            "url": "http://localhost:5000",
+            "remote_url": "http://frontend:5000",
+            "remote_directory": "/shared/buffers/myproject/STAGE-prod",
+        },
+        {
+            "readonly": True,
+            "url": "http://localhost:5001",
+            "remote_url": "http://frontend:5001",
+            "remote_directory": "/shared/buffers/myproject/STAGE-prod",
+        },
+        {
+            "readonly": True,
+            "url": "http://localhost:5002",
+            "remote_url": "http://frontend:5002",
+        },
+    ]
@@ -0,0 +1,23 @@
+import json
+
+from seamless_config.extern_clients import decode_remote_clients
+
+CLIENTS = {
+    "database": [{"readonly": False, "url": "http://db", "remote_url": "http://node:1"}],
+    "buffer": [
+        {"readonly": True, "remote_directory": "/shared/buffers"},
+        {"readonly": False, "url": "http://hash", "remote_url": "http://node:2"},
+    ],
+}
+
+
+def test_decode_plain_json():
+    value = json.dumps(CLIENTS)
+    assert decode_remote_clients(value) == CLIENTS
+    assert decode_remote_clients(value) is decode_remote_clients(value)
+
+
+def test_decode_file_reference(tmp_path):
+    path = tmp_path / "remote-clients.json"
+    path.write_text(json.dumps(CLIENTS), encoding="utf-8")
+    assert decode_remote_clients("@" + str(path)) == CLIENTS
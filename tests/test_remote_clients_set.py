@@ -48,3 +48,31 @@ def test_set_remote_clients_registers_clients(monkeypatch, tmp_path):
         seamless_config.set_stage()
     with pytest.raises(RuntimeError):
         seamless_config.set_workdir("/tmp")
+
+
+def test_set_remote_clients_does_not_retry_activation(monkeypatch):
+    from seamless_remote import database_remote, buffer_remote
+
+    db_activations = []
+
+    def db_define(name, type_, **kwargs):
+        pass
+
+    def db_activate(**kwargs):
+        db_activations.append(kwargs)
+        raise RuntimeError("Unknown extern client: extern-db-0")
+
+    monkeypatch.setattr(database_remote, "define_extern_client", db_define)
+    monkeypatch.setattr(database_remote, "activate", db_activate)
+    monkeypatch.setattr(buffer_remote, "DISABLED", True)
+    monkeypatch.setattr(seamless_config, "_initialized", False)
+    monkeypatch.setattr(seamless_config, "_remote_clients_set", False)
+
+    clients = {
+        "database": [{"readonly": True, "url": "http://db"}],
+        "connect_policy": {"max_attempts": 5, "base_delay": 0.1},
+    }
+    # Activation only registers the clients: it is not retried
+    with pytest.raises(RuntimeError, match="Unknown extern client"):
+        set_remote_clients(clients)
+    assert len(db_activations) == 1
@@ -0,0 +1,77 @@
+import pytest
+
+import seamless_config.retry as retry
+
+
+def test_call_with_retry_retries_until_success(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda delay: None)
+    retry.reset_connect_metrics()
+    calls = []
+
+    def connect():
+        calls.append(None)
+        if len(calls) < 3:
+            raise ConnectionError("refused")
+        return "connected"
+
+    policy = {"max_attempts": 5, "base_delay": 0.1, "max_delay": 1, "budget": None}
+    assert retry.call_with_retry(connect, policy, "hashserver") == "connected"
+    metrics = retry.get_connect_metrics()["hashserver"]
+    assert metrics["attempts"] == 3
+    assert metrics["failures"] == 2
+    assert metrics["successes"] == 1
+    assert metrics["gave_up"] == 0
+    assert metrics["last_error"] == "ConnectionError: refused"
+
+
+def test_call_with_retry_gives_up(monkeypatch):
+    delays = []
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    retry.reset_connect_metrics()
+
+    def connect():
+        raise ConnectionError("refused")
+
+    policy = {"max_attempts": 4, "base_delay": 1, "max_delay": 2, "budget": None}
+    with pytest.raises(ConnectionError):
+        retry.call_with_retry(connect, policy, "database")
+    assert len(delays) == 3
+    assert all(0 <= delay <= 2 for delay in delays)
+    assert retry.get_connect_metrics()["database"]["gave_up"] == 1
+
+
+def test_call_with_retry_does_not_retry_configuration_errors(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda delay: None)
+    retry.reset_connect_metrics()
+
+    def connect():
+        raise ValueError("bad entry")
+
+    with pytest.raises(ValueError):
+        retry.call_with_retry(connect, {"max_attempts": 5}, "buffer")
+    assert retry.get_connect_metrics()["buffer"]["attempts"] == 1
+
+
+def test_call_with_retry_retries_wrapped_connection_errors(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda delay: None)
+    retry.reset_connect_metrics()
+    calls = []
+
+    def connect():
+        calls.append(None)
+        try:
+            raise ConnectionRefusedError("refused")
+        except ConnectionRefusedError as exc:
+            raise RuntimeError("Healthcheck failed for http://hash") from exc
+
+    with pytest.raises(RuntimeError):
+        retry.call_with_retry(connect, {"max_attempts": 3}, "buffer")
+    assert len(calls) == 3
+
+    def configure():
+        raise RuntimeError("Unknown extern client: extern-buffer-0")
+
+    retry.reset_connect_metrics()
+    with pytest.raises(RuntimeError):
+        retry.call_with_retry(configure, {"max_attempts": 3}, "buffer")
+    assert retry.get_connect_metrics()["buffer"]["attempts"] == 1
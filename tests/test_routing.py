@@ -0,0 +1,149 @@
+import pytest
+
+import seamless_config.cluster as cluster
+import seamless_config.pure_daskserver as pure_daskserver
+import seamless_config.select as select
+from seamless_config import ConfigurationError
+from seamless_config.routing import (
+    parse_resource_hints,
+    parse_walltime,
+    pool_resources,
+    route_queue,
+)
+
+
+def _define(queues):
+    cluster.define_clusters(
+        {
+            "mycluster": {
+                "type": "slurm",
+                "tunnel": False,
+                "frontends": [{"hostname": "frontend"}],
+                "queues": queues,
+                "default_queue": next(iter(queues)),
+            }
+        }
+    )
+
+
+@pytest.fixture
+def selection(monkeypatch):
+    monkeypatch.setattr(select, "_current_cluster", "mycluster")
+    monkeypatch.setattr(select, "_current_queue", None)
+    monkeypatch.setattr(select, "_queue_source", None)
+    monkeypatch.setattr(select, "_queue_cluster", None)
+    monkeypatch.setattr(select, "_current_queue_overrides", None)
+    monkeypatch.setattr(select, "_current_queue_routing", False)
+    monkeypatch.setattr(select, "_current_worker_pools", None)
+    _define(
+        {
+            "short": {"conda": "seamless", "walltime": "01:00:00", "cores": 4, "memory": "8GB"},
+            "long": {"conda": "seamless", "walltime": "2-00:00:00", "cores": 4, "memory": "8GB"},
+            "bigmem": {"conda": "seamless", "walltime": "12:00:00", "cores": 16, "memory": "512GB"},
+            "gpu": {
+                "conda": "seamless",
+                "walltime": "12:00:00",
+                "cores": 8,
+                "memory": "64GB",
+                "dask_resources": {"GPU": 2},
+            },
+        }
+    )
+
+
+def test_parse_walltime():
+    assert parse_walltime("01:30:00") == 5400
+    assert parse_walltime("1-00:00:10") == 86410
+    assert parse_walltime("2h") == 7200
+    with pytest.raises(ValueError):
+        parse_walltime("1:2:3:4")
+
+
+def test_parse_resource_hints_rejects_unknown_hints():
+    assert parse_resource_hints({"memory": "1GB", "cores": 2}) == {
+        "memory": 1e9,
+        "cores": 2.0,
+    }
+    with pytest.raises(ValueError, match="Unknown resource hint 'ram'"):
+        parse_resource_hints({"ram": "1GB"})
+    with pytest.raises(ValueError):
+        parse_resource_hints({"cores": -1})
+
+
+def test_route_to_smallest_fitting_queue(selection):
+    assert route_queue({}) == "short"
+    assert route_queue({"walltime": "3h"}) == "long"
+    # GPU queues are only used when GPUs are requested
+    assert route_queue({"memory": "20GB"}) == "bigmem"
+    assert route_queue({"cores": 8, "memory": "16GB"}) == "bigmem"
+    assert route_queue({"gpus": 1}) == "gpu"
+    with pytest.raises(ConfigurationError, match="No queue"):
+        route_queue({"gpus": 1, "walltime": "1-12:00:00"})
+
+
+def test_route_prefers_explicit_cost(selection):
+    _define(
+        {
+            "cheap-but-big": {"conda": "seamless", "cores": 64, "memory": "1TB", "cost": 1},
+            "small": {"conda": "seamless", "cores": 2, "memory": "4GB"},
+            "pricey": {"conda": "seamless", "cores": 2, "memory": "4GB", "cost": 5},
+        }
+    )
+    assert route_queue({"cores": 1}) == "cheap-but-big"
+    with pytest.raises(TypeError, match="'cost'"):
+        _define({"q": {"conda": "seamless", "cores": 1, "cost": -1}})
+
+
+def test_route_applies_queue_overrides(selection):
+    select.select_queue_overrides({"walltime": "1-00:00:00"})
+    assert route_queue({"walltime": "20h"}) == "short"
+
+
+def test_route_applies_queue_overrides_to_selected_queue_only(selection):
+    select.select_queue("long")
+    select.select_queue_overrides({"memory": "512GB"})
+    # Only the selected queue gets the extra memory, not "short"
+    assert route_queue({"memory": "128GB"}) == "long"
+    select.select_queue("bigmem")
+    assert route_queue({"memory": "128GB"}) == "bigmem"
+
+
+def test_client_for_resources(selection, monkeypatch):
+    launched = []
+
+    class FakeHandle:
+        def __init__(self, cluster, queue, frontend_name, *, set_as_default=True):
+            launched.append((queue, set_as_default))
+            self.queue = queue
+            self.client = f"client-{queue}"
+
+    monkeypatch.setattr(pure_daskserver, "PureDaskserverLaunchedHandle", FakeHandle)
+    monkeypatch.setattr(pure_daskserver, "_launched_handle", FakeHandle("mycluster", "short", None))
+    monkeypatch.setattr(pure_daskserver, "_queue_handles", {})
+    launched.clear()
+
+    # Routing is off by default
+    assert pure_daskserver.get_client_for_resources({"gpus": 1}) == "client-short"
+    select.select_queue_routing(True)
+    assert pure_daskserver.get_client_for_resources({"walltime": "10m"}) == "client-short"
+    assert pure_daskserver.get_client_for_resources({"gpus": 1}) == "client-gpu"
+    assert pure_daskserver.get_client_for_resources({"gpus": 2}) == "client-gpu"
+    assert launched == [("gpu", False)]
+
+    # A worker pool of the main daskserver is reached through the main client
+    select.select_worker_pools(["bigmem"])
+    assert pure_daskserver.get_client_for_resources({"memory": "100GB"}) == "client-short"
+    assert launched == [("gpu", False)]
+
+
+def test_pool_resources(selection):
+    # Without worker pools and queue routing, tasks are not pinned
+    assert pool_resources({"gpus": 1}) == {}
+    select.select_worker_pools(["gpu"])
+    assert pool_resources({"gpus": 1}) == {}
+    select.select_queue_routing(True)
+    assert pool_resources({"gpus": 1}) == {"pool-gpu": 1}
+    assert pool_resources({"cores": 1}) == {"pool-short": 1}
+    assert pool_resources(None) == {}
+    # A queue that is not a pool of the main daskserver has its own client
+    assert pool_resources({"memory": "100GB"}) == {}
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import yaml
+
+import seamless_config.config_files as config_files
+import seamless_config.tools as tools
+from seamless_config._tools_data import SOURCE_SHA256, TOOLS
+
+
+def _regex_substitute(template, injected):
+    # The substitution as it was done before templates were compiled
+    result = template
+    for m in reversed(list(tools.DOLLAR_RE.finditer(template))):
+        start, end = m.span()
+        result = result[:start] + str(injected[m.group()[1:]]) + result[end:]
+    return result
+
+
+def test_tools_data_matches_tools_yaml():
+    tools_file = Path(config_files.__file__).with_name(config_files.TOOLS_FILENAME)
+    assert SOURCE_SHA256 == config_files._tools_file_checksum(tools_file), (
+        "_tools_data.py is stale: run 'python -m seamless_config.config_files'"
+    )
+    with tools_file.open("r", encoding="utf-8") as handle:
+        assert TOOLS == yaml.safe_load(handle)
+
+
+def test_load_tools_falls_back_to_yaml(tmp_path):
+    tools_file = tmp_path / config_files.TOOLS_FILENAME
+    tools_file.write_text("{}\n", encoding="utf-8")
+    assert config_files._load_tools_data(tools_file) is None
+
+
+def test_compiled_templates_match_regex_substitution():
+    injected = {
+        "CLUSTER": "mycluster",
+        "BUFFERDIR": "/buffers",
+        "DATABASE_DIR": "/db",
+        "PROJECTSUBDIR": "/proj/sub",
+        "STAGEDIR": "/STAGE-build",
+        "MODE": "rw",
+    }
+    for toolname, tool in TOOLS.items():
+        compiled = tools._CompiledTool(tool)
+        for key, value, is_template in compiled.items:
+            if not is_template:
+                continue
+            template = tool[key + "_template"]
+            names = [m.group()[1:] for m in tools.DOLLAR_RE.finditer(template)]
+            values = {name: injected.get(name, f"<{name}>") for name in names}
+            assert value.render(values) == _regex_substitute(template, values), (
+                toolname,
+                key,
+            )